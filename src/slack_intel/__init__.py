@@ -1,41 +1,40 @@
 """Slack Intelligence - LLM-optimized Slack message processing"""
 
-from .slack_channels import (
-    SlackChannelManager,
-    SlackChannel,
-    TimeWindow,
-    SlackMessage,
-    SlackThread,
-    JiraTicket,
-    ChannelAnalytics,
-    SlackUser,
-    SlackFile,
-    SlackReaction,
-    JiraSprint,
-    JiraProgress,
-)
-from .parquet_cache import ParquetCache
-from .utils import convert_slack_dicts_to_messages
-from .cli import cli
-from .sql_view_composer import SqlViewComposer
-from .enriched_message_view_formatter import EnrichedMessageViewFormatter
+import importlib
 
-__all__ = [
-    "SlackChannelManager",
-    "SlackChannel",
-    "TimeWindow",
-    "SlackMessage",
-    "SlackThread",
-    "JiraTicket",
-    "ChannelAnalytics",
-    "SlackUser",
-    "SlackFile",
-    "SlackReaction",
-    "JiraSprint",
-    "JiraProgress",
-    "ParquetCache",
-    "convert_slack_dicts_to_messages",
-    "cli",
-    "SqlViewComposer",
-    "EnrichedMessageViewFormatter",
-]
+# Public names resolve to their submodule on first access, so the
+# `slack-intel` entry point only pays for the clients a subcommand uses.
+_EXPORTS = {
+    "SlackChannelManager": ".slack_channels",
+    "SlackChannel": ".slack_channels",
+    "TimeWindow": ".slack_channels",
+    "SlackMessage": ".slack_channels",
+    "SlackThread": ".slack_channels",
+    "JiraTicket": ".slack_channels",
+    "ChannelAnalytics": ".slack_channels",
+    "SlackUser": ".slack_channels",
+    "SlackFile": ".slack_channels",
+    "SlackReaction": ".slack_channels",
+    "JiraSprint": ".slack_channels",
+    "JiraProgress": ".slack_channels",
+    "ParquetCache": ".parquet_cache",
+    "convert_slack_dicts_to_messages": ".utils",
+    "cli": ".cli",
+    "SqlViewComposer": ".sql_view_composer",
+    "EnrichedMessageViewFormatter": ".enriched_message_view_formatter",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
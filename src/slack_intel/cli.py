@@ -1,21 +1,18 @@
 """CLI interface for Slack Intelligence tool"""
 
 import asyncio
+import os
+import traceback
 import click
 import duckdb
-import yaml
 from pathlib import Path
 from datetime import datetime
 from typing import List, Optional
 from rich.console import Console
-from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 import json
 
-from .slack_channels import SlackChannelManager, SlackChannel, TimeWindow
-from .parquet_cache import ParquetCache
-from .utils import convert_slack_dicts_to_messages
 from .parquet_user_reader import ParquetUserReader
 from .thread_reconstructor import ThreadReconstructor
 from .message_view_formatter import MessageViewFormatter, ViewContext
@@ -26,6 +23,9 @@ from .s3_sync import create_syncer
 console = Console()
 
 
+# Full tracebacks on errors; also enabled per run with `slack-intel --debug`
+DEBUG = os.environ.get("SLACK_INTEL_DEBUG", "") not in ("", "0")
+
 # Default channels configuration
 DEFAULT_CHANNELS = [
     {"name": "general", "id": "C0123456789"},
@@ -62,10 +62,24 @@ def load_full_config_with_fallback():
     return load_full_config()
 
 
+def print_debug_traceback() -> None:
+    """Print the current exception's traceback when debug output is enabled
+
+    Call from an except block. Tracebacks are shown with --debug or
+    SLACK_INTEL_DEBUG=1; otherwise only a hint is printed.
+    """
+    if DEBUG:
+        console.print(f"[dim]{traceback.format_exc()}[/dim]")
+    else:
+        console.print("[dim]Run with --debug (or SLACK_INTEL_DEBUG=1) for the full traceback[/dim]")
+
+
 @click.group()
-def cli():
+@click.option('--debug', is_flag=True, help='Show full tracebacks on errors (or set SLACK_INTEL_DEBUG=1)')
+def cli(debug):
     """Slack Intelligence - Cache and query Slack messages in Parquet format"""
-    pass
+    global DEBUG
+    DEBUG = DEBUG or debug
 
 
 @cli.command()
@@ -82,9 +96,10 @@ def setup(config_only):
 
     You can also run `config init` afterward to add organizational context.
     """
-    import os
     import stat
+    import yaml
     from .credentials import check_config_file_security
+    from .slack_channels import SlackChannelManager
 
     console.print(Panel.fit(
         "[bold cyan]Slack Intelligence Setup[/bold cyan]\n"
@@ -308,6 +323,10 @@ def cache(channel, days, end_date, cache_path, enrich_jira):
 
 async def _cache_async(channel_ids, days, end_date, cache_path, enrich_jira):
     """Async implementation of cache command"""
+    from rich.table import Table
+    from .slack_channels import SlackChannelManager, SlackChannel, TimeWindow
+    from .parquet_cache import ParquetCache
+    from .utils import convert_slack_dicts_to_messages
 
     # Determine channels to process
     if channel_ids:
@@ -337,20 +356,19 @@ async def _cache_async(channel_ids, days, end_date, cache_path, enrich_jira):
         border_style="blue"
     ))
 
-    # Results table and JIRA ticket collection
+    # Results table and partitions written during this run
     results = []
-    all_jira_ticket_ids = set()  # Collect unique JIRA tickets across all channels
-    all_mentioned_user_ids = set()  # Collect unique mentioned users across all channels
-
-    # Process each channel
-    for channel in channels:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console
-        ) as progress:
+    cached_partition_paths = []  # Scanned with DuckDB for JIRA tickets and mentions
+
+    # Process each channel under a single live display
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        console=console
+    ) as progress:
+        for channel in channels:
             task = progress.add_task(
                 f"[cyan]Fetching {channel.name}...", total=None
             )
@@ -405,21 +423,7 @@ async def _cache_async(channel_ids, days, end_date, cache_path, enrich_jira):
                     partition_paths.append(file_path)
                     total_size += Path(file_path).stat().st_size
 
-                # Extract JIRA tickets from messages if enrichment is enabled
-                if enrich_jira:
-                    for message in messages:
-                        jira_tickets = message.to_parquet_dict().get('jira_tickets', [])
-                        if jira_tickets:
-                            all_jira_ticket_ids.update(jira_tickets)
-
-                # Extract user mentions from message text for user cache
-                import re
-                mention_pattern = r'<@(U[A-Z0-9]+)>'
-                for message in messages:
-                    message_text = message.text if hasattr(message, 'text') else ""
-                    if message_text:
-                        mentions = re.findall(mention_pattern, message_text)
-                        all_mentioned_user_ids.update(mentions)
+                cached_partition_paths.extend(partition_paths)
 
                 # Calculate total size
                 file_size_mb = total_size / (1024 * 1024)
@@ -444,15 +448,17 @@ async def _cache_async(channel_ids, days, end_date, cache_path, enrich_jira):
                 console.print(f"[green]  ✓ Cached {len(messages)} messages from {channel.name}[/green]")
 
             except Exception as e:
-                import traceback
                 console.print(f"[red]  ✗ Error processing {channel.name}: {e}[/red]")
-                console.print(f"[dim]{traceback.format_exc()}[/dim]")
+                print_debug_traceback()
                 results.append({
                     "channel": channel.name,
                     "messages": 0,
                     "status": "error",
                     "path": str(e)
                 })
+            finally:
+                # Drop the finished channel's spinner; status lines stay printed
+                progress.remove_task(task)
 
     # Summary table
     if results:
@@ -481,6 +487,16 @@ async def _cache_async(channel_ids, days, end_date, cache_path, enrich_jira):
         total_size = sum(r.get("size_mb", 0) for r in results)
         console.print(f"\n[bold]Total:[/bold] {total_messages} messages, {total_size:.2f} MB cached")
 
+    # Collect unique JIRA tickets and mentioned users from the partitions just written
+    try:
+        all_jira_ticket_ids, all_mentioned_user_ids = _collect_partition_ids(
+            cached_partition_paths,
+            include_jira=enrich_jira
+        )
+    except Exception as e:
+        console.print(f"[yellow]  ⚠ Could not scan cached partitions: {e}[/yellow]")
+        all_jira_ticket_ids, all_mentioned_user_ids = set(), set()
+
     # JIRA Enrichment Phase
     if enrich_jira and all_jira_ticket_ids:
         console.print()
@@ -639,14 +655,55 @@ async def _cache_async(channel_ids, days, end_date, cache_path, enrich_jira):
 
             except Exception as e:
                 console.print(f"[red]  ✗ User cache enrichment failed: {e}[/red]")
-                import traceback
-                console.print(f"[dim]{traceback.format_exc()}[/dim]")
+                print_debug_traceback()
 
     elif all_mentioned_user_ids:
         console.print()
         console.print("[dim]No mentioned users found in messages[/dim]")
 
 
+def _collect_partition_ids(partition_paths: List[str], include_jira: bool = False) -> tuple:
+    """Extract unique JIRA ticket IDs and mentioned user IDs from cached partitions
+
+    Lets DuckDB scan only the `jira_tickets` and `text` columns of the Parquet
+    files written by the cache run, instead of a Python pass over every message.
+
+    Args:
+        partition_paths: Parquet files written during this cache run
+        include_jira: Whether to collect JIRA ticket IDs
+
+    Returns:
+        Tuple of (jira_ticket_ids, mentioned_user_ids) sets
+    """
+    jira_ticket_ids = set()
+    mentioned_user_ids = set()
+
+    if not partition_paths:
+        return jira_ticket_ids, mentioned_user_ids
+
+    files = sorted(set(partition_paths))
+    conn = duckdb.connect()
+
+    try:
+        if include_jira:
+            rows = conn.execute(
+                "SELECT DISTINCT UNNEST(jira_tickets) FROM read_parquet(?)",
+                [files]
+            ).fetchall()
+            jira_ticket_ids = {row[0] for row in rows if row[0]}
+
+        rows = conn.execute(
+            "SELECT DISTINCT UNNEST(regexp_extract_all(text, '<@(U[A-Z0-9]+)>', 1)) "
+            "FROM read_parquet(?)",
+            [files]
+        ).fetchall()
+        mentioned_user_ids = {row[0] for row in rows if row[0]}
+    finally:
+        conn.close()
+
+    return jira_ticket_ids, mentioned_user_ids
+
+
 @cli.command()
 @click.option('--query', '-q', help='SQL query to run')
 @click.option('--interactive', '-i', is_flag=True, help='Interactive SQL mode (REPL)')
@@ -689,6 +746,8 @@ def query(query, interactive, cache_path, format, limit):
 
 def _run_query(conn, sql_query, cache_path, output_format, limit):
     """Execute a single SQL query"""
+    from rich.table import Table
+
     try:
         # Add LIMIT if not present in query
         if "limit" not in sql_query.lower() and limit:
@@ -777,6 +836,9 @@ def stats(cache_path, format):
         # Export as JSON
         slack-intel stats --format json
     """
+    from rich.table import Table
+    from .parquet_cache import ParquetCache
+
     parquet_cache = ParquetCache(base_path=cache_path)
 
     try:
@@ -1084,8 +1146,6 @@ def view(channel, merge_channels, user, include_mentions, bucket_by, days, end_d
             )
             formatter = EnrichedMessageViewFormatter()
 
-        view_output = formatter.format(structured_messages, context, cached_users=cached_users)
-
         # Resolve output path: explicit -o takes priority, then --auto-save
         if not output and auto_save:
             timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
@@ -1103,16 +1163,18 @@ def view(channel, merge_channels, user, include_mentions, bucket_by, days, end_d
         if output:
             output_path = Path(output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(view_output)
+            # Stream straight to disk rather than building the whole view in memory
+            with output_path.open("w") as fh:
+                formatter.format_to(structured_messages, context, fh, cached_users=cached_users)
             console.print(f"[green]✓ View saved to {output}[/green]")
         else:
+            view_output = formatter.format(structured_messages, context, cached_users=cached_users)
             console.print()
             console.print(view_output)
 
     except Exception as e:
         console.print(f"[red]Error generating view: {e}[/red]")
-        import traceback
-        console.print(f"[dim]{traceback.format_exc()}[/dim]")
+        print_debug_traceback()
 
 
 @cli.command()
@@ -1167,7 +1229,7 @@ def process(channel, merge_channels, user, include_mentions, bucket_by, days, en
         # Use custom parameters
         slack-intel process -c general --temperature 0.5 --max-tokens 2000
     """
-    import os
+    from rich.table import Table
     from .pipeline import ChainProcessor
     from .credentials import get_openai_key, CredentialError
 
@@ -1543,8 +1605,7 @@ Generated by slack-intel on {result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}
 
     except Exception as e:
         console.print(f"[red]Error processing messages: {e}[/red]")
-        import traceback
-        console.print(f"[dim]{traceback.format_exc()}[/dim]")
+        print_debug_traceback()
 
 
 @cli.command()
@@ -1555,7 +1616,13 @@ Generated by slack-intel on {result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}
 @click.option('--profile', help='AWS profile name (overrides config file, supports SSO)')
 @click.option('--delete', is_flag=True, help='Delete S3 files not present locally')
 @click.option('--dry-run', is_flag=True, help='Show what would be synced without uploading')
-def sync(bucket, prefix, cache_path, region, profile, delete, dry_run):
+@click.option('--workers', default=32, type=int, help='Concurrent uploads (default: 32)')
+@click.option('--multipart-chunksize-mb', default=16, type=click.IntRange(min=5),
+              help='Part size for multipart uploads of files over 64 MB (min: 5, the S3 part size floor; default: 16)')
+@click.option('--force-rescan', is_flag=True, help='Ignore the local sync manifest and re-check every file')
+@click.option('--async', 'use_async', is_flag=True,
+              help='Upload from one asyncio event loop (requires aioboto3; uses uvloop if installed)')
+def sync(bucket, prefix, cache_path, region, profile, delete, dry_run, workers, multipart_chunksize_mb, force_rescan, use_async):
     """Sync cached Parquet files to S3
 
     Uses incremental sync - only uploads new or modified files.
@@ -1582,14 +1649,22 @@ def sync(bucket, prefix, cache_path, region, profile, delete, dry_run):
         # Sync with deletion of remote files not present locally
         slack-intel sync --delete
 
+        \b
+        # Raise upload concurrency for caches with many small partitions
+        slack-intel sync --workers 64
+
+        \b
+        # Upload from an asyncio event loop (pip install 'slack-intel[async]')
+        slack-intel sync --async --workers 128
+
         \b
         # Use specific AWS profile and region (overrides config)
         slack-intel sync --profile prod --region us-west-2
     """
-    # Load config
-    config_channels = load_config()
+    from rich.table import Table
+    from .config import load_yaml
 
-    # Extract S3 storage config from loaded config
+    # Extract S3 storage config (project config first, then home)
     storage_config = {}
     config_paths = [
         Path(".slack-intel.yaml"),
@@ -1599,12 +1674,11 @@ def sync(bucket, prefix, cache_path, region, profile, delete, dry_run):
     for config_path in config_paths:
         if config_path.exists():
             try:
-                with open(config_path) as f:
-                    config = yaml.safe_load(f)
-                    if config and "storage" in config:
-                        storage_config = config["storage"]
-                        console.print(f"[dim]Loaded S3 config from {config_path}[/dim]")
-                        break
+                config = load_yaml(config_path)
+                if config and "storage" in config:
+                    storage_config = config["storage"]
+                    console.print(f"[dim]Loaded S3 config from {config_path}[/dim]")
+                    break
             except Exception as e:
                 console.print(f"[yellow]Warning: Failed to load {config_path}: {e}[/yellow]")
                 continue
@@ -1648,19 +1722,26 @@ def sync(bucket, prefix, cache_path, region, profile, delete, dry_run):
     ))
 
     try:
+        from .s3_sync import build_transfer_config
+
         # Create S3 syncer
         console.print("[dim]Initializing S3 syncer...[/dim]")
+        transfer_config = build_transfer_config(multipart_chunksize_mb * 1024 * 1024)
         syncer = create_syncer(
             bucket=final_bucket,
             prefix=final_prefix,
             region=final_region,
-            aws_profile=final_profile
+            aws_profile=final_profile,
+            max_workers=workers,
+            transfer_config=transfer_config
         )
 
         # Perform sync
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
             console=console
         ) as progress:
             task = progress.add_task(
@@ -1672,10 +1753,16 @@ def sync(bucket, prefix, cache_path, region, profile, delete, dry_run):
                 local_path=cache_dir,
                 delete=delete,
                 dry_run=dry_run,
-                include_patterns=["**/*.parquet"]
+                include_patterns=["**/*.parquet"],
+                progress_callback=lambda done, total: progress.update(
+                    task, completed=done, total=total
+                ),
+                force_rescan=force_rescan,
+                use_async=use_async
             )
 
-            progress.update(task, completed=True)
+            done = result.files_uploaded or 1
+            progress.update(task, completed=done, total=done)
 
         # Display results
         if dry_run:
@@ -1710,8 +1797,7 @@ def sync(bucket, prefix, cache_path, region, profile, delete, dry_run):
             console.print(f"  - Test profile with: aws --profile {final_profile} s3 ls s3://{final_bucket}/")
     except Exception as e:
         console.print(f"[red]Sync failed: {e}[/red]")
-        import traceback
-        console.print(f"[dim]{traceback.format_exc()}[/dim]")
+        print_debug_traceback()
 
 
 @cli.group()
@@ -1806,8 +1892,7 @@ def config_init(cache_path, org_name, output, force):
 
     except Exception as e:
         console.print(f"[red]Error generating config: {e}[/red]")
-        import traceback
-        console.print(f"[dim]{traceback.format_exc()}[/dim]")
+        print_debug_traceback()
 
 
 @config.command('sync-users')
@@ -1895,8 +1980,7 @@ def config_sync_users(cache_path, config_path):
 
     except Exception as e:
         console.print(f"[red]Error syncing users: {e}[/red]")
-        import traceback
-        console.print(f"[dim]{traceback.format_exc()}[/dim]")
+        print_debug_traceback()
 
 
 if __name__ == "__main__":
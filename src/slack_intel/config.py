@@ -7,8 +7,12 @@ and stakeholder maps from .slack-intel.yaml
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 from dataclasses import dataclass, field
+from functools import lru_cache
 import yaml
 
+# Use libyaml's C parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class Stakeholder:
@@ -112,6 +116,29 @@ class SlackIntelConfig:
         return None
 
 
+def load_yaml(path: Path) -> Any:
+    """Parse a YAML file, reusing the parsed result until the file changes
+
+    Results are cached per process keyed by path and modification time, so
+    commands that consult the same config file more than once parse it once.
+    The returned data is shared between callers and must not be mutated.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML content (None for an empty file)
+    """
+    path = Path(path)
+    return _load_yaml_cached(str(path.resolve()), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_cached(path_str: str, mtime_ns: int) -> Any:
+    with open(path_str) as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
 def load_config(config_path: Optional[Path] = None) -> SlackIntelConfig:
     """Load enhanced configuration from YAML file
 
@@ -138,10 +165,9 @@ def load_config(config_path: Optional[Path] = None) -> SlackIntelConfig:
     for path in config_paths:
         if path.exists():
             try:
-                with open(path) as f:
-                    raw_config = yaml.safe_load(f)
-                    if raw_config:
-                        return _parse_config(raw_config, path)
+                raw_config = load_yaml(path)
+                if raw_config:
+                    return _parse_config(raw_config, path)
             except Exception as e:
                 print(f"Warning: Failed to load {path}: {e}")
                 continue
@@ -10,7 +10,8 @@ Environment variables always take precedence over config file values.
 import os
 from pathlib import Path
 from typing import Optional, Tuple
-import yaml
+
+from .config import load_yaml
 
 
 class CredentialError(Exception):
@@ -38,8 +39,7 @@ def _load_config_file() -> dict:
     for config_path in search_paths:
         if config_path.exists():
             try:
-                with open(config_path, 'r') as f:
-                    return yaml.safe_load(f) or {}
+                return load_yaml(config_path) or {}
             except Exception as e:
                 # If config file is malformed, continue to next location
                 print(f"Warning: Could not load config from {config_path}: {e}")
@@ -4,10 +4,18 @@ Extends MessageViewFormatter to display enriched JIRA ticket metadata
 (summary, status, priority, assignee) instead of just ticket IDs.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, NamedTuple
 from .message_view_formatter import MessageViewFormatter, ViewContext
 
 
+class TicketDisplay(NamedTuple):
+    """JIRA ticket fields ready for display (defaults applied, summary truncated)"""
+    priority: str
+    status: str
+    summary: str
+    assignee: str
+
+
 class EnrichedMessageViewFormatter(MessageViewFormatter):
     """Message formatter with JIRA metadata enrichment
 
@@ -23,6 +31,11 @@ class EnrichedMessageViewFormatter(MessageViewFormatter):
         >>> print(view)
     """
 
+    # Enriched ticket summaries longer than this are cut and end in the ellipsis
+    SUMMARY_MAX_LENGTH = 50
+    SUMMARY_ELLIPSIS = "..."
+    SUMMARY_CUT = SUMMARY_MAX_LENGTH - len(SUMMARY_ELLIPSIS)
+
     def __init__(self, template: str = "llm_optimized", resolve_mentions: bool = True, bucket_type: str = None):
         """Initialize enriched formatter
 
@@ -32,17 +45,74 @@ class EnrichedMessageViewFormatter(MessageViewFormatter):
             bucket_type: Time bucketing for multi-channel views
         """
         super().__init__(template=template, resolve_mentions=resolve_mentions, bucket_type=bucket_type)
+        self._ticket_index: Dict[str, TicketDisplay] = {}  # ticket_id -> display fields
+
+    def _format_into(
+        self,
+        messages: List[Dict[str, Any]],
+        context: ViewContext,
+        out: List[str],
+        cached_users: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> None:
+        """Append the formatted view lines for messages to out
+
+        Builds the ticket metadata index once for the whole message set
+        before delegating to the base formatter.
+        """
+        self._ticket_index = self._build_ticket_index(messages)
+        super()._format_into(messages, context, out, cached_users=cached_users)
 
-    def _format_jira_tickets(self, msg: Dict[str, Any], indent: str = "   ") -> List[str]:
+    @classmethod
+    def _build_ticket_index(cls, messages: List[Dict[str, Any]]) -> Dict[str, TicketDisplay]:
+        """Index JIRA display fields by ticket_id across all messages and replies
+
+        Metadata is joined per ticket in the SQL view, so every occurrence of
+        a ticket carries the same entry and one index serves the whole view.
+        Defaults and summary truncation are applied once per ticket here
+        rather than on every occurrence.
+
+        Args:
+            messages: List of structured message dicts
+
+        Returns:
+            Dict mapping ticket_id to its TicketDisplay
+        """
+        index = {}
+        for msg in messages:
+            for item in [msg, *(msg.get("replies") or [])]:
+                jira_metadata = item.get("jira_metadata")
+                if jira_metadata is None:
+                    continue
+                for meta in jira_metadata:
+                    if meta and "ticket_id" in meta and meta["ticket_id"] not in index:
+                        index[meta["ticket_id"]] = cls._ticket_display(meta)
+        return index
+
+    @classmethod
+    def _ticket_display(cls, meta: Dict[str, Any]) -> TicketDisplay:
+        """Build display fields from a jira_metadata entry, handling None values"""
+        summary = meta.get("summary") or "No summary"
+
+        return TicketDisplay(
+            priority=meta.get("priority") or "Unknown",
+            status=meta.get("status") or "Unknown",
+            # Truncate summary if too long
+            summary=(
+                summary[:cls.SUMMARY_CUT] + cls.SUMMARY_ELLIPSIS
+                if len(summary) > cls.SUMMARY_MAX_LENGTH
+                else summary
+            ),
+            assignee=meta.get("assignee") or "Unassigned",
+        )
+
+    def _format_jira_tickets(self, msg: Dict[str, Any], out: List[str], indent: str = "   ") -> None:
         """Format JIRA tickets with enriched metadata if available
 
         Args:
             msg: Message dict potentially containing jira_tickets and jira_metadata
+            out: Output line buffer to append the JIRA ticket display to
             indent: Indentation string for formatting
 
-        Returns:
-            List of formatted lines for JIRA ticket display
-
         Example output:
             ```
             🎫 JIRA Tickets:
@@ -51,86 +121,69 @@ class EnrichedMessageViewFormatter(MessageViewFormatter):
                  Assignee: DeviBharat
             ```
         """
-        jira_tickets = msg.get("jira_tickets", [])
+        # Most messages carry no tickets: leave before touching metadata.
+        # Rows built through pandas carry numpy arrays, so no bare truthiness.
+        jira_tickets = msg.get("jira_tickets")
         if jira_tickets is None or len(jira_tickets) == 0:
-            return []
+            return
 
-        jira_metadata = msg.get("jira_metadata", [])
+        jira_metadata = msg.get("jira_metadata")
 
         # If no metadata available, fall back to simple ticket ID display
         if jira_metadata is None or len(jira_metadata) == 0:
-            return [f"{indent}🎫 JIRA: {', '.join(jira_tickets)}"]
+            out.append(f"{indent}🎫 JIRA: {', '.join(jira_tickets)}")
+            return
 
-        # Build metadata lookup by ticket_id
-        metadata_map = {
-            meta["ticket_id"]: meta
-            for meta in jira_metadata
-            if meta and "ticket_id" in meta
-        }
+        # Display fields by ticket_id, built once per format() call
+        ticket_index = self._ticket_index
 
-        lines = [f"{indent}🎫 JIRA Tickets:"]
+        out.append(f"{indent}🎫 JIRA Tickets:")
 
         for ticket_id in jira_tickets:
-            meta = metadata_map.get(ticket_id)
-
-            if meta:
-                # Enriched display - handle None values
-                priority = meta.get("priority") or "Unknown"
-                status = meta.get("status") or "Unknown"
-                summary = meta.get("summary") or "No summary"
-                assignee = meta.get("assignee") or "Unassigned"
-
-                # Truncate summary if too long
-                if summary and len(summary) > 50:
-                    summary = summary[:47] + "..."
+            ticket = ticket_index.get(ticket_id)
 
+            if ticket:
                 # Format: • TICKET-ID [Priority] Status
-                lines.append(f"{indent}   • {ticket_id} [{priority}] {status}")
+                out.append(f"{indent}   • {ticket_id} [{ticket.priority}] {ticket.status}")
                 # Format:   "Summary..."
-                lines.append(f'{indent}     "{summary}"')
+                out.append(f'{indent}     "{ticket.summary}"')
                 # Format:   Assignee: Name
-                lines.append(f"{indent}     Assignee: {assignee}")
+                out.append(f"{indent}     Assignee: {ticket.assignee}")
             else:
                 # Fallback: just show ticket ID if metadata missing
-                lines.append(f"{indent}   • {ticket_id}")
-
-        return lines
+                out.append(f"{indent}   • {ticket_id}")
 
-    def _format_message_compact(self, msg: Dict[str, Any], msg_number: int) -> str:
+    def _format_message_compact(self, msg: Dict[str, Any], msg_number: int, out: List[str]) -> None:
         """Format a message in compact style with enriched JIRA for bucketed views
 
         Overrides parent method to use enriched JIRA ticket display.
         """
-        lines = []
+        get = msg.get
 
         # User and timestamp
-        user_name = msg.get("user_real_name", "Unknown User")
-        timestamp = self._format_timestamp_short(msg.get("timestamp", ""))
+        user_name = get("user_real_name", "Unknown User")
+        timestamp = self._format_timestamp_short(get("timestamp", ""))
 
-        text = self._resolve_mentions(msg.get("text", ""))
-        lines.append(f"  💬 {user_name} at {timestamp}:")
-        lines.append(f"     {text}")
+        text = self._resolve_text(get("text", ""))
+        out.append(f"  💬 {user_name} at {timestamp}:")
+        out.append(f"     {text}")
 
         # Reactions (compact)
-        reactions = msg.get("reactions", [])
+        reactions = get("reactions")
         if reactions is not None and len(reactions) > 0:
-            reaction_strs = [f"{r.get('emoji', '')}({r.get('count', 0)})" for r in reactions]
-            lines.append(f"     😊 {', '.join(reaction_strs)}")
+            reaction_list = ", ".join([f"{r.get('emoji', '')}({r.get('count', 0)})" for r in reactions])
+            out.append(f"     😊 {reaction_list}")
 
         # Files (compact)
-        files = msg.get("files", [])
+        files = get("files")
         if files is not None and len(files) > 0:
             file_names = [f.get("name", "file") for f in files]
-            lines.append(f"     📎 {', '.join(file_names)}")
+            out.append(f"     📎 {', '.join(file_names)}")
 
         # JIRA tickets with enrichment (compact)
-        jira_lines = self._format_jira_tickets(msg, indent="     ")
-        if jira_lines:
-            lines.extend(jira_lines)
-
-        return "\n".join(lines)
+        self._format_jira_tickets(msg, out, indent="     ")
 
-    def _format_message(self, msg: Dict[str, Any], msg_number: int) -> str:
+    def _format_message(self, msg: Dict[str, Any], msg_number: int, out: List[str]) -> None:
         """Format a parent message with enriched JIRA tickets
 
         Overrides parent method to use enriched JIRA ticket display.
@@ -138,66 +191,49 @@ class EnrichedMessageViewFormatter(MessageViewFormatter):
         Args:
             msg: Message dict
             msg_number: Sequential message number for display
-
-        Returns:
-            Formatted message string
+            out: Output line buffer to append the formatted message to
         """
-        lines = []
+        get = msg.get
 
         # Message header
         clipped_indicator = ""
-        if msg.get("is_clipped_thread") or msg.get("is_orphaned_reply"):
+        if get("is_clipped_thread") or get("is_orphaned_reply"):
             clipped_indicator = " (🔗 Thread clipped)"
 
-        lines.append(f"💬 MESSAGE #{msg_number}{clipped_indicator}")
+        out.append(f"💬 MESSAGE #{msg_number}{clipped_indicator}")
 
         # Show channel name if multi-channel context (like user timeline)
-        if hasattr(self, 'context') and self.context:
-            context_channels = getattr(self.context, 'channels', [])
-            if context_channels and len(context_channels) > 1:
-                channel = msg.get("channel", "unknown")
-                lines.append(f"📍 Channel: #{channel}")
+        if self._show_channel:
+            channel = get("channel", "unknown")
+            out.append(f"📍 Channel: #{channel}")
 
         # User and timestamp
-        user_name = msg.get("user_real_name", "Unknown User")
-        timestamp = self._format_timestamp(msg.get("timestamp", ""))
+        user_name = get("user_real_name", "Unknown User")
+        timestamp = self._format_timestamp(get("timestamp", ""))
 
-        text = self._resolve_mentions(msg.get("text", ""))
-        lines.append(f"👤 {user_name} at {timestamp}:")
-        lines.append(f"   {text}")
+        text = self._resolve_text(get("text", ""))
+        out.append(f"👤 {user_name} at {timestamp}:")
+        out.append(f"   {text}")
 
         # Reactions
-        reactions = msg.get("reactions", [])
+        reactions = get("reactions")
         if reactions is not None and len(reactions) > 0:
-            reaction_strs = []
-            for reaction in reactions:
-                emoji = reaction.get("emoji", "")
-                count = reaction.get("count", 0)
-                reaction_strs.append(f"{emoji}({count})")
-
-            lines.append(f"   😊 Reactions: {', '.join(reaction_strs)}")
+            reaction_list = ", ".join([f"{r.get('emoji', '')}({r.get('count', 0)})" for r in reactions])
+            out.append(f"   😊 Reactions: {reaction_list}")
 
         # Files
-        files = msg.get("files", [])
+        files = get("files")
         if files is not None and len(files) > 0:
-            file_names = []
-            for file in files:
-                name = file.get("name", "unknown")
-                mimetype = file.get("mimetype", "")
-                if mimetype:
-                    file_names.append(f"{name} ({mimetype})")
-                else:
-                    file_names.append(name)
-
-            lines.append(f"   📎 Files: {', '.join(file_names)}")
+            file_names = [
+                f"{f.get('name', 'unknown')} ({f['mimetype']})" if f.get("mimetype") else f.get("name", "unknown")
+                for f in files
+            ]
+            out.append(f"   📎 Files: {', '.join(file_names)}")
 
         # JIRA tickets (enriched)
-        jira_lines = self._format_jira_tickets(msg, indent="   ")
-        lines.extend(jira_lines)
-
-        return "\n".join(lines)
+        self._format_jira_tickets(msg, out, indent="   ")
 
-    def _format_reply(self, reply: Dict[str, Any], reply_number: int) -> str:
+    def _format_reply(self, reply: Dict[str, Any], reply_number: int, out: List[str]) -> None:
         """Format a thread reply with enriched JIRA tickets
 
         Overrides parent method to use enriched JIRA ticket display.
@@ -205,31 +241,21 @@ class EnrichedMessageViewFormatter(MessageViewFormatter):
         Args:
             reply: Reply message dict
             reply_number: Sequential reply number for display
-
-        Returns:
-            Formatted reply string
+            out: Output line buffer to append the formatted reply to
         """
-        user_name = reply.get("user_real_name", "Unknown User")
-        timestamp = self._format_timestamp(reply.get("timestamp", ""))
-        text = self._resolve_mentions(reply.get("text", ""))
+        get = reply.get
+        user_name = get("user_real_name", "Unknown User")
+        timestamp = self._format_timestamp(get("timestamp", ""))
+        text = self._resolve_text(get("text", ""))
 
-        lines = []
-        lines.append(f"    ↳ REPLY #{reply_number}: {user_name} at {timestamp}:")
-        lines.append(f"       {text}")
+        out.append(f"    ↳ REPLY #{reply_number}: {user_name} at {timestamp}:")
+        out.append(f"       {text}")
 
         # Reactions on reply
-        reactions = reply.get("reactions", [])
+        reactions = get("reactions")
         if reactions is not None and len(reactions) > 0:
-            reaction_strs = []
-            for reaction in reactions:
-                emoji = reaction.get("emoji", "")
-                count = reaction.get("count", 0)
-                reaction_strs.append(f"{emoji}({count})")
-
-            lines.append(f"       😊 Reactions: {', '.join(reaction_strs)}")
+            reaction_list = ", ".join([f"{r.get('emoji', '')}({r.get('count', 0)})" for r in reactions])
+            out.append(f"       😊 Reactions: {reaction_list}")
 
         # JIRA tickets in reply (enriched)
-        jira_lines = self._format_jira_tickets(reply, indent="       ")
-        lines.extend(jira_lines)
-
-        return "\n".join(lines)
+        self._format_jira_tickets(reply, out, indent="       ")
@@ -4,12 +4,144 @@ Generates human and LLM-readable text output from structured message data,
 matching the format of generate_llm_optimized_text() in slack_channels.py
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TextIO
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 import re
 from .time_bucketer import TimeBucketer, TimeBucket
 
+# Slack user mention: <@USER_ID> where USER_ID starts with U
+MENTION_PATTERN = re.compile(r'<@(U[A-Z0-9]+)>')
+
+# Dividers between view sections, messages, and channel groups in a bucket
+SECTION_DIVIDER = "=" * 80
+MESSAGE_DIVIDER = "-" * 60
+CHANNEL_DIVIDER = "-" * 50
+
+# Separators as single buffer entries; the view is joined with newlines,
+# so each renders as its divider with the surrounding blank lines
+MESSAGE_SEPARATOR = f"\n{MESSAGE_DIVIDER}\n"  # after each message block
+CHANNEL_SEPARATOR = f"{CHANNEL_DIVIDER}\n"     # after each channel group in a bucket
+BUCKET_SEPARATOR = f"{SECTION_DIVIDER}\n"      # after each time bucket
+
+# Formatted timestamps are memoized per raw string; busy channels repeat
+# the same second many times. Cleared on every format() call so relative
+# times ("2 hours ago") never go stale in long-running processes.
+TIMESTAMP_CACHE_SIZE = 4096
+
+# Relative time units as (upper bound in seconds, unit length in seconds, name);
+# ages below a minute are "just now", ages past the last bound count in years
+RELATIVE_TIME_UNITS = (
+    (3600, 60, "min"),             # Less than 1 hour
+    (86400, 3600, "hour"),         # Less than 1 day
+    (604800, 86400, "day"),        # Less than 1 week
+    (2592000, 604800, "week"),     # Less than 30 days
+    (31536000, 2592000, "month"),  # Less than 1 year
+)
+SECONDS_PER_YEAR = 31536000
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def _format_timestamp_short_cached(timestamp_str: str) -> str:
+    """Memoized body of MessageViewFormatter._format_timestamp_short"""
+    if not timestamp_str:
+        return "unknown"
+
+    try:
+        dt = datetime.fromisoformat(timestamp_str)
+        # "HH:MM" sliced from isoformat, which is cheaper than strftime
+        return dt.isoformat(" ", "minutes")[11:16]
+    except (ValueError, TypeError):
+        return timestamp_str[:5] if len(timestamp_str) >= 5 else timestamp_str
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def _format_timestamp_cached(timestamp_str: str, now: datetime) -> str:
+    """Memoized body of MessageViewFormatter._format_timestamp
+
+    now is the aware UTC time captured once per format() call.
+    """
+    if not timestamp_str:
+        return "unknown time"
+
+    try:
+        # fromisoformat accepts the "Z" suffix directly (Python 3.11+)
+        dt = datetime.fromisoformat(timestamp_str)
+
+        # Format absolute time: "YYYY-MM-DD HH:MM" sliced from isoformat,
+        # which is cheaper than strftime's format-string parsing
+        absolute_time = dt.isoformat(" ", "minutes")[:16]
+
+        # Calculate relative time
+        relative_time = _relative_time(dt, now)
+
+        return f"{absolute_time} ({relative_time})"
+    except (ValueError, TypeError):
+        # Fallback for malformed timestamps
+        return timestamp_str[:16] if len(timestamp_str) >= 16 else timestamp_str
+
+
+def _relative_time(dt: datetime, now: datetime) -> str:
+    """Get human-readable relative time from datetime
+
+    Args:
+        dt: Datetime object to calculate relative time from
+        now: Current time as an aware datetime
+
+    Returns:
+        Relative time string (e.g., "2 mins ago", "3 hours ago", "5 days ago")
+    """
+    if dt.tzinfo is None:
+        # Naive timestamps are local time
+        now = now.astimezone().replace(tzinfo=None)
+    diff = now - dt
+
+    # Whole seconds, floored; comparisons against the integer bounds are
+    # unchanged by dropping the fraction
+    seconds = diff.days * 86400 + diff.seconds
+
+    if seconds < 60:
+        return "just now"
+
+    for bound, unit_seconds, unit in RELATIVE_TIME_UNITS:
+        if seconds < bound:
+            count = seconds // unit_seconds
+            break
+    else:
+        count = seconds // SECONDS_PER_YEAR
+        unit = "year"
+
+    return f"{count} {unit}{'s' if count != 1 else ''} ago"
+
+
+def _keep_text(text: str) -> str:
+    """Mention resolver used when resolution is disabled"""
+    return text
+
+
+class _StreamLines:
+    """Line sink that writes appended lines to a text stream
+
+    Stands in for the output line list so views can be streamed; lines are
+    newline-separated with no trailing newline, matching "\\n".join().
+    """
+
+    def __init__(self, stream: TextIO):
+        self._write = stream.write
+        self._started = False
+
+    def append(self, line: str) -> None:
+        if self._started:
+            self._write("\n")
+        else:
+            self._started = True
+        self._write(line)
+
+    def extend(self, lines: List[str]) -> None:
+        for line in lines:
+            self.append(line)
+
 
 @dataclass
 class ViewMetadata:
@@ -73,6 +205,12 @@ class MessageViewFormatter:
         self.resolve_mentions = resolve_mentions
         self.bucket_type = bucket_type
         self.user_mapping: Dict[str, str] = {}  # user_id -> display name
+        self._mention_cache: Dict[str, str] = {}  # raw text -> resolved text, per format() call
+        self._pending_mapping = None  # (messages, cached_users) not yet folded into user_mapping
+        self._resolve_text = self._resolve_mentions  # mention resolver for the current format() call
+        self._now = datetime.now(timezone.utc)  # reference time for relative timestamps, per format() call
+        self.context: Optional[ViewContext] = None  # context of the current format() call
+        self._show_channel = False  # label each message with its channel (multi-channel context)
 
     @staticmethod
     def compute_metadata(
@@ -117,7 +255,7 @@ class MessageViewFormatter:
                     leadership_messages += 1
 
             # Check for thread
-            replies = msg.get("replies", [])
+            replies = msg.get("replies")
             if replies:
                 total_threads += 1
                 reply_count = len(replies)
@@ -167,101 +305,172 @@ class MessageViewFormatter:
         Returns:
             Formatted text string ready for LLM consumption or human reading
         """
+        out: List[str] = []
+        self._format_into(messages, context, out, cached_users=cached_users)
+        return "\n".join(out)
+
+    def format_to(
+        self,
+        messages: List[Dict[str, Any]],
+        context: ViewContext,
+        stream: TextIO,
+        cached_users: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> None:
+        """Format messages and write the view straight to a text stream
+
+        Produces exactly the text format() returns, without holding the
+        whole view in memory.
+
+        Args:
+            messages: List of structured message dicts (with nested "replies" if applicable)
+            context: View context with channel info, date range, etc.
+            stream: Writable text stream (e.g. an open output file)
+            cached_users: Optional dict of cached user data (user_id -> user_dict)
+
+        Example:
+            >>> with open("view.txt", "w") as fh:
+            ...     formatter.format_to(messages, context, fh)
+        """
+        self._format_into(messages, context, _StreamLines(stream), cached_users=cached_users)
+
+    def _format_into(
+        self,
+        messages: List[Dict[str, Any]],
+        context: ViewContext,
+        out: List[str],
+        cached_users: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> None:
+        """Append the formatted view lines for messages to out"""
         if not messages:
-            return self._format_empty_view(context)
+            self._format_empty_view(context, out)
+            return
 
         # Store context for use in formatting methods
         self.context = context
+        self._show_channel = bool(context.channels) and len(context.channels) > 1
 
-        # Build user ID -> name mapping if mention resolution is enabled
+        # Build user ID -> name mapping if mention resolution is enabled.
+        # Deferred to the first text with a mention, so views without
+        # mentions walk the messages only once
         if self.resolve_mentions:
-            self._build_user_mapping(messages, cached_users=cached_users)
+            self._ensure_user_mapping()
+            self._pending_mapping = (messages, cached_users)
+
+        # Without resolution texts pass through untouched; bind a no-op so
+        # per-text calls skip the resolver's checks
+        self._resolve_text = self._resolve_mentions if self.resolve_mentions else _keep_text
+
+        # Resolved texts depend on the mapping, so never reuse them across calls
+        self._mention_cache.clear()
+
+        # One clock read per call; relative times are computed against it
+        self._now = datetime.now(timezone.utc)
+        _format_timestamp_cached.cache_clear()
 
         # Check if multi-channel view with bucketing
         if self.bucket_type and len(context.channels) > 1:
-            return self._format_bucketed_view(messages, context)
+            self._format_bucketed_view(messages, context, out)
         else:
-            return self._format_single_channel_view(messages, context)
+            self._format_single_channel_view(messages, context, out)
 
     def _format_single_channel_view(
         self,
         messages: List[Dict[str, Any]],
-        context: ViewContext
-    ) -> str:
+        context: ViewContext,
+        out: List[str]
+    ) -> None:
         """Format traditional single-channel view (original behavior)"""
-        output_lines = []
-
         # Header
-        output_lines.extend(self._format_header(context, messages))
-        output_lines.append("")
+        self._format_header(context, messages, out)
+        out.append("")
 
         # Messages
-        message_count = 0
-        thread_count = 0
-        total_replies = 0
+        message_count = len(messages)
+        thread_count, total_replies = self._format_message_blocks(messages, 1, out)
 
-        for msg in messages:
-            message_count += 1
+        # Summary
+        self._format_summary(message_count, thread_count, total_replies, out)
 
-            # Format parent message
-            formatted_msg = self._format_message(msg, message_count)
-            output_lines.append(formatted_msg)
+    def _format_message_block(self, msg: Dict[str, Any], msg_number: int, out: List[str]) -> int:
+        """Format a parent message with its thread section and separator
 
-            # Check for thread replies
-            replies = msg.get("replies", [])
-            if replies:
-                thread_count += 1
-                total_replies += len(replies)
+        Args:
+            msg: Message dict (with nested "replies" if applicable)
+            msg_number: Sequential message number for display
+            out: Output line buffer to append to
 
-                # Check if thread is clipped
-                is_clipped = msg.get("is_clipped_thread") or msg.get("has_clipped_replies")
-                expected_replies = msg.get("reply_count", 0)
+        Returns:
+            Number of thread replies formatted (0 if the message has no thread)
+        """
+        # Format parent message
+        self._format_message(msg, msg_number, out)
+
+        # Check for thread replies
+        replies = msg.get("replies")
+        if replies:
+            # Check if thread is clipped
+            is_clipped = msg.get("is_clipped_thread") or msg.get("has_clipped_replies")
+            expected_replies = msg.get("reply_count", 0)
+
+            out.append("")
+            if is_clipped and expected_replies > len(replies):
+                out.append(f"  🧵 THREAD REPLIES (showing {len(replies)} of {expected_replies}+ replies):")
+            else:
+                out.append("  🧵 THREAD REPLIES:")
 
-                output_lines.append("")
-                if is_clipped and expected_replies > len(replies):
-                    output_lines.append(f"  🧵 THREAD REPLIES (showing {len(replies)} of {expected_replies}+ replies):")
-                else:
-                    output_lines.append("  🧵 THREAD REPLIES:")
+            # Format each reply
+            for i, reply in enumerate(replies, 1):
+                self._format_reply(reply, i, out)
 
-                # Format each reply
-                for i, reply in enumerate(replies, 1):
-                    formatted_reply = self._format_reply(reply, i)
-                    output_lines.append(formatted_reply)
+            # Clipped thread hint
+            if is_clipped and expected_replies > len(replies):
+                out.append("")
+                out.append("  💡 Thread may have additional replies outside this time range")
 
-                # Clipped thread hint
-                if is_clipped and expected_replies > len(replies):
-                    output_lines.append("")
-                    output_lines.append("  💡 Thread may have additional replies outside this time range")
+        # Check if this is an orphaned reply
+        elif msg.get("is_orphaned_reply"):
+            out.append("  🔗 Thread clipped (parent message outside time window)")
+            out.append("  💡 Widen date range to see full thread")
 
-            # Check if this is an orphaned reply
-            elif msg.get("is_orphaned_reply"):
-                output_lines.append("  🔗 Thread clipped (parent message outside time window)")
-                output_lines.append("  💡 Widen date range to see full thread")
+        out.append(MESSAGE_SEPARATOR)
 
-            output_lines.append("")
-            output_lines.append("-" * 60)
-            output_lines.append("")
+        return len(replies) if replies else 0
 
-        # Summary
-        output_lines.extend(self._format_summary(message_count, thread_count, total_replies))
+    def _format_message_blocks(self, messages: List[Dict[str, Any]], start_number: int, out: List[str]) -> tuple:
+        """Format a run of consecutive message blocks
 
-        return "\n".join(output_lines)
+        Args:
+            messages: Consecutive structured messages
+            start_number: Display number of the first message
+            out: Output line buffer to append to
+
+        Returns:
+            Tuple of (thread_count, total_replies)
+        """
+        thread_count = 0
+        total_replies = 0
+        for msg_number, msg in enumerate(messages, start_number):
+            reply_count = self._format_message_block(msg, msg_number, out)
+            if reply_count:
+                thread_count += 1
+                total_replies += reply_count
+
+        return thread_count, total_replies
 
     def _format_bucketed_view(
         self,
         messages: List[Dict[str, Any]],
-        context: ViewContext
-    ) -> str:
+        context: ViewContext,
+        out: List[str]
+    ) -> None:
         """Format multi-channel view with time bucketing
 
         Groups messages into time buckets (hour/day), then within each bucket
         displays messages grouped by channel for better UX.
         """
-        output_lines = []
-
         # Header
-        output_lines.extend(self._format_header(context, messages))
-        output_lines.append("")
+        self._format_header(context, messages, out)
+        out.append("")
 
         # Create time bucketer and bucket messages
         bucketer = TimeBucketer(bucket_type=self.bucket_type)
@@ -274,69 +483,61 @@ class MessageViewFormatter:
 
         # Format each bucket
         for bucket_idx, bucket in enumerate(buckets, 1):
-            output_lines.extend(self._format_bucket_header(bucket, bucket_idx))
-            output_lines.append("")
+            self._format_bucket_header(bucket, bucket_idx, out)
+            out.append("")
 
             # Format messages for each channel in this bucket
             for channel in bucket.get_channels():
                 channel_messages = bucket.messages_by_channel[channel]
+                total_message_count += len(channel_messages)
 
-                output_lines.append(f"📱 #{channel} ({len(channel_messages)} messages)")
-                output_lines.append("")
+                out.append(f"📱 #{channel} ({len(channel_messages)} messages)")
+                out.append("")
 
                 # Format messages in this channel
                 for msg_idx, msg in enumerate(channel_messages, 1):
-                    total_message_count += 1
-
                     # Format message (simplified for bucketed view)
-                    formatted_msg = self._format_message_compact(msg, msg_idx)
-                    output_lines.append(formatted_msg)
+                    self._format_message_compact(msg, msg_idx, out)
 
                     # Check for thread replies
-                    replies = msg.get("replies", [])
+                    replies = msg.get("replies")
                     if replies:
                         total_thread_count += 1
                         total_reply_count += len(replies)
 
-                        output_lines.append("")
-                        output_lines.append("  🧵 THREAD REPLIES:")
+                        out.append("")
+                        out.append("  🧵 THREAD REPLIES:")
 
                         for reply_idx, reply in enumerate(replies, 1):
-                            formatted_reply = self._format_reply(reply, reply_idx)
-                            output_lines.append(formatted_reply)
+                            self._format_reply(reply, reply_idx, out)
 
-                    output_lines.append("")
+                    out.append("")
 
-                output_lines.append("-" * 50)
-                output_lines.append("")
+                out.append(CHANNEL_SEPARATOR)
 
-            # Bucket separator
-            output_lines.append("=" * 80)
-            output_lines.append("")
+            out.append(BUCKET_SEPARATOR)
 
         # Overall summary
-        output_lines.extend(self._format_summary(
+        self._format_summary(
             total_message_count,
             total_thread_count,
-            total_reply_count
-        ))
-
-        return "\n".join(output_lines)
+            total_reply_count,
+            out
+        )
 
-    def _format_header(self, context: ViewContext, messages: List[Dict[str, Any]]) -> List[str]:
+    def _format_header(self, context: ViewContext, messages: List[Dict[str, Any]], out: List[str]) -> None:
         """Format header section with optional metadata and organizational context"""
-        lines = []
-        lines.append("=" * 80)
+        out.append(SECTION_DIVIDER)
 
         # Organization context
         if context.org_context and context.org_context.get("name"):
             org_name = context.org_context.get("name")
-            lines.append(f"🏢 ORGANIZATION: {org_name}")
+            out.append(f"🏢 ORGANIZATION: {org_name}")
 
         # Channel info
         if context.channels:
             # Multi-channel view
-            lines.append(f"📱 SLACK CHANNELS: {', '.join(context.channels)}")
+            out.append(f"📱 SLACK CHANNELS: {', '.join(context.channels)}")
 
             # Add channel descriptions if available
             if context.org_context and context.org_context.get("channels"):
@@ -345,10 +546,10 @@ class MessageViewFormatter:
                     # Try with and without channel_ prefix
                     ch_config = channel_map.get(channel_name) or channel_map.get(channel_name.replace("channel_", ""))
                     if ch_config and ch_config.get("description"):
-                        lines.append(f"   • {channel_name}: {ch_config['description']}")
+                        out.append(f"   • {channel_name}: {ch_config['description']}")
         else:
             # Single channel view
-            lines.append(f"📱 SLACK CHANNEL: {context.channel_name}")
+            out.append(f"📱 SLACK CHANNEL: {context.channel_name}")
 
             # Add channel description if available
             if context.org_context and context.org_context.get("channels"):
@@ -356,47 +557,43 @@ class MessageViewFormatter:
                 ch_name = context.channel_name.replace("channel_", "")
                 ch_config = channel_map.get(ch_name)
                 if ch_config and ch_config.get("description"):
-                    lines.append(f"   Purpose: {ch_config['description']}")
+                    out.append(f"   Purpose: {ch_config['description']}")
 
         # Date range
         if context.date_range:
-            lines.append(f"⏰ TIME WINDOW: {context.date_range}")
+            out.append(f"⏰ TIME WINDOW: {context.date_range}")
 
         # Metadata section (if computed)
         if context.metadata:
-            lines.append("")
-            lines.append("📊 CONVERSATION METRICS:")
+            out.append("")
+            out.append("📊 CONVERSATION METRICS:")
             meta = context.metadata
-            lines.append(f"   • Total Messages: {meta.total_messages}")
-            lines.append(f"   • Active Threads: {meta.total_threads} ({meta.total_replies} replies)")
+            out.append(f"   • Total Messages: {meta.total_messages}")
+            out.append(f"   • Active Threads: {meta.total_threads} ({meta.total_replies} replies)")
             if meta.avg_thread_depth > 0:
-                lines.append(f"   • Avg Thread Depth: {meta.avg_thread_depth:.1f} replies")
-            lines.append(f"   • Unique Participants: {meta.unique_participants}")
+                out.append(f"   • Avg Thread Depth: {meta.avg_thread_depth:.1f} replies")
+            out.append(f"   • Unique Participants: {meta.unique_participants}")
             if meta.high_engagement_threads > 0:
-                lines.append(f"   • High Engagement Threads: {meta.high_engagement_threads} (5+ replies)")
+                out.append(f"   • High Engagement Threads: {meta.high_engagement_threads} (5+ replies)")
             if meta.leadership_messages > 0:
-                lines.append(f"   • Leadership Involvement: {meta.leadership_messages} messages from key stakeholders")
+                out.append(f"   • Leadership Involvement: {meta.leadership_messages} messages from key stakeholders")
 
         # Stakeholder context (if available)
         if context.org_context and context.org_context.get("stakeholders"):
             stakeholders = context.org_context["stakeholders"]
             if stakeholders:
-                lines.append("")
-                lines.append("👥 KEY STAKEHOLDERS:")
+                out.append("")
+                out.append("👥 KEY STAKEHOLDERS:")
                 for s in stakeholders[:5]:  # Show top 5
                     role = s.get("role", "")
                     weight = s.get("weight", 5)
                     attention_level = "🔴" if weight >= 9 else "🟠" if weight >= 7 else "🟡"
-                    lines.append(f"   {attention_level} {s.get('name', '')} - {role}")
+                    out.append(f"   {attention_level} {s.get('name', '')} - {role}")
 
-        lines.append("=" * 80)
+        out.append(SECTION_DIVIDER)
 
-        return lines
-
-    def _format_bucket_header(self, bucket: TimeBucket, bucket_number: int) -> List[str]:
+    def _format_bucket_header(self, bucket: TimeBucket, bucket_number: int, out: List[str]) -> None:
         """Format header for a time bucket"""
-        lines = []
-
         # Format time range based on bucket type
         if self.bucket_type == "hour":
             time_label = bucket.start_time.strftime("%Y-%m-%d %H:00-%H:59")
@@ -405,191 +602,177 @@ class MessageViewFormatter:
         else:
             time_label = "All Messages"
 
-        lines.append("=" * 80)
-        lines.append(f"📅 TIME BUCKET: {time_label}")
-        lines.append(f"   Total Messages: {bucket.total_messages} across {bucket.get_channel_count()} channels")
-        lines.append("=" * 80)
-
-        return lines
+        out.extend((
+            SECTION_DIVIDER,
+            f"📅 TIME BUCKET: {time_label}",
+            f"   Total Messages: {bucket.total_messages} across {bucket.get_channel_count()} channels",
+            SECTION_DIVIDER,
+        ))
 
-    def _format_message_compact(self, msg: Dict[str, Any], msg_number: int) -> str:
-        """Format a message in compact style for bucketed views"""
-        lines = []
+    def _format_message_compact(self, msg: Dict[str, Any], msg_number: int, out: List[str]) -> None:
+        """Format a message in compact style for bucketed views, appending lines to out"""
+        get = msg.get
 
         # User and timestamp
-        user_name = msg.get("user_real_name", "Unknown User")
-        timestamp = self._format_timestamp_short(msg.get("timestamp", ""))
+        user_name = get("user_real_name", "Unknown User")
+        timestamp = self._format_timestamp_short(get("timestamp", ""))
 
-        text = self._resolve_mentions(msg.get("text", ""))
-        lines.append(f"  💬 {user_name} at {timestamp}:")
-        lines.append(f"     {text}")
+        text = self._resolve_text(get("text", ""))
+        out.append(f"  💬 {user_name} at {timestamp}:")
+        out.append(f"     {text}")
 
         # Reactions (compact)
-        reactions = msg.get("reactions", [])
+        reactions = get("reactions")
         if reactions:
-            reaction_strs = [f"{r.get('emoji', '')}({r.get('count', 0)})" for r in reactions]
-            lines.append(f"     😊 {', '.join(reaction_strs)}")
+            reaction_list = ", ".join([f"{r.get('emoji', '')}({r.get('count', 0)})" for r in reactions])
+            out.append(f"     😊 {reaction_list}")
 
         # Files (compact)
-        files = msg.get("files", [])
+        files = get("files")
         if files:
             file_names = [f.get("name", "file") for f in files]
-            lines.append(f"     📎 {', '.join(file_names)}")
+            out.append(f"     📎 {', '.join(file_names)}")
 
         # JIRA tickets
-        jira_tickets = msg.get("jira_tickets", [])
+        jira_tickets = get("jira_tickets")
         if jira_tickets:
-            lines.append(f"     🎫 {', '.join(jira_tickets)}")
-
-        return "\n".join(lines)
+            out.append(f"     🎫 {', '.join(jira_tickets)}")
 
-    def _format_message(self, msg: Dict[str, Any], msg_number: int) -> str:
-        """Format a single parent message"""
-        lines = []
+    def _format_message(self, msg: Dict[str, Any], msg_number: int, out: List[str]) -> None:
+        """Format a single parent message, appending lines to out"""
+        get = msg.get
 
         # Message header
         clipped_indicator = ""
-        if msg.get("is_clipped_thread") or msg.get("is_orphaned_reply"):
+        if get("is_clipped_thread") or get("is_orphaned_reply"):
             clipped_indicator = " (🔗 Thread clipped)"
 
-        lines.append(f"💬 MESSAGE #{msg_number}{clipped_indicator}")
+        out.append(f"💬 MESSAGE #{msg_number}{clipped_indicator}")
 
         # Show channel name if multi-channel context (like user timeline)
-        if hasattr(self, 'context') and self.context:
-            context_channels = getattr(self.context, 'channels', [])
-            if context_channels and len(context_channels) > 1:
-                channel = msg.get("channel", "unknown")
-                lines.append(f"📍 Channel: #{channel}")
+        if self._show_channel:
+            channel = get("channel", "unknown")
+            out.append(f"📍 Channel: #{channel}")
 
         # User and timestamp
-        user_name = msg.get("user_real_name", "Unknown User")
-        timestamp = self._format_timestamp(msg.get("timestamp", ""))
+        user_name = get("user_real_name", "Unknown User")
+        timestamp = self._format_timestamp(get("timestamp", ""))
 
-        text = self._resolve_mentions(msg.get("text", ""))
-        lines.append(f"👤 {user_name} at {timestamp}:")
-        lines.append(f"   {text}")
+        text = self._resolve_text(get("text", ""))
+        out.append(f"👤 {user_name} at {timestamp}:")
+        out.append(f"   {text}")
 
         # Reactions
-        reactions = msg.get("reactions", [])
+        reactions = get("reactions")
         if reactions:
-            reaction_strs = []
-            for reaction in reactions:
-                emoji = reaction.get("emoji", "")
-                count = reaction.get("count", 0)
-                reaction_strs.append(f"{emoji}({count})")
-
-            lines.append(f"   😊 Reactions: {', '.join(reaction_strs)}")
+            reaction_list = ", ".join([f"{r.get('emoji', '')}({r.get('count', 0)})" for r in reactions])
+            out.append(f"   😊 Reactions: {reaction_list}")
 
         # Files
-        files = msg.get("files", [])
+        files = get("files")
         if files:
-            file_names = []
-            for file in files:
-                name = file.get("name", "unknown")
-                mimetype = file.get("mimetype", "")
-                if mimetype:
-                    file_names.append(f"{name} ({mimetype})")
-                else:
-                    file_names.append(name)
-
-            lines.append(f"   📎 Files: {', '.join(file_names)}")
+            file_names = [
+                f"{f.get('name', 'unknown')} ({f['mimetype']})" if f.get("mimetype") else f.get("name", "unknown")
+                for f in files
+            ]
+            out.append(f"   📎 Files: {', '.join(file_names)}")
 
         # JIRA tickets
-        jira_tickets = msg.get("jira_tickets", [])
+        jira_tickets = get("jira_tickets")
         if jira_tickets:
-            lines.append(f"   🎫 JIRA: {', '.join(jira_tickets)}")
+            out.append(f"   🎫 JIRA: {', '.join(jira_tickets)}")
 
-        return "\n".join(lines)
+    def _format_reply(self, reply: Dict[str, Any], reply_number: int, out: List[str]) -> None:
+        """Format a thread reply, appending lines to out"""
+        get = reply.get
+        user_name = get("user_real_name", "Unknown User")
+        timestamp = self._format_timestamp(get("timestamp", ""))
+        text = self._resolve_text(get("text", ""))
 
-    def _format_reply(self, reply: Dict[str, Any], reply_number: int) -> str:
-        """Format a thread reply"""
-        user_name = reply.get("user_real_name", "Unknown User")
-        timestamp = self._format_timestamp(reply.get("timestamp", ""))
-        text = self._resolve_mentions(reply.get("text", ""))
-
-        lines = []
-        lines.append(f"    ↳ REPLY #{reply_number}: {user_name} at {timestamp}:")
-        lines.append(f"       {text}")
+        out.append(f"    ↳ REPLY #{reply_number}: {user_name} at {timestamp}:")
+        out.append(f"       {text}")
 
         # Reactions on reply
-        reactions = reply.get("reactions", [])
+        reactions = get("reactions")
         if reactions:
-            reaction_strs = []
-            for reaction in reactions:
-                emoji = reaction.get("emoji", "")
-                count = reaction.get("count", 0)
-                reaction_strs.append(f"{emoji}({count})")
-
-            lines.append(f"       😊 Reactions: {', '.join(reaction_strs)}")
+            reaction_list = ", ".join([f"{r.get('emoji', '')}({r.get('count', 0)})" for r in reactions])
+            out.append(f"       😊 Reactions: {reaction_list}")
 
         # Files on reply
-        files = reply.get("files", [])
+        files = get("files")
         if files:
             file_names = [f.get("name", "unknown") for f in files]
-            lines.append(f"       📎 Files: {', '.join(file_names)}")
-
-        return "\n".join(lines)
+            out.append(f"       📎 Files: {', '.join(file_names)}")
 
-    def _format_summary(self, message_count: int, thread_count: int, total_replies: int) -> List[str]:
+    def _format_summary(self, message_count: int, thread_count: int, total_replies: int, out: List[str]) -> None:
         """Format summary statistics section"""
-        lines = []
-        lines.append("📊 CONVERSATION SUMMARY:")
-        lines.append(f"   • Total Messages: {message_count}")
-        lines.append(f"   • Total Thread Replies: {total_replies}")
-        lines.append(f"   • Active Threads: {thread_count}")
-
-        return lines
-
-    def _format_empty_view(self, context: ViewContext) -> str:
-        """Format view for empty message list"""
-        lines = []
-        lines.append("=" * 80)
-        lines.append(f"📱 SLACK CHANNEL: {context.channel_name}")
-        if context.date_range:
-            lines.append(f"⏰ TIME WINDOW: {context.date_range}")
-        lines.append("=" * 80)
-        lines.append("")
-        lines.append("No messages found in the specified time window.")
-        lines.append("")
-        lines.append("=" * 80)
+        out.extend((
+            "📊 CONVERSATION SUMMARY:",
+            f"   • Total Messages: {message_count}",
+            f"   • Total Thread Replies: {total_replies}",
+            f"   • Active Threads: {thread_count}",
+        ))
 
-        return "\n".join(lines)
+    def _format_empty_view(self, context: ViewContext, out: List[str]) -> None:
+        """Format view for empty message list, appending lines to out"""
+        out.append(SECTION_DIVIDER)
+        out.append(f"📱 SLACK CHANNEL: {context.channel_name}")
+        if context.date_range:
+            out.append(f"⏰ TIME WINDOW: {context.date_range}")
+        out.extend((
+            SECTION_DIVIDER,
+            "",
+            "No messages found in the specified time window.",
+            "",
+            SECTION_DIVIDER,
+        ))
 
     def _build_user_mapping(self, messages: List[Dict[str, Any]], cached_users: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
         """Build user_id -> display name mapping from messages and cached users
 
         Starts with cached user data as base, then overlays with message authors
-        (who have fresher data). Recursively processes messages and replies.
+        (who have fresher data). Walks messages and replies in order without
+        recursion, so the last occurrence of a user wins as before.
 
         Args:
             messages: List of message dicts (potentially with nested replies)
             cached_users: Optional dict of cached user data (user_id -> user_dict)
                          Used as base mapping for users not in messages
         """
+        mapping = self.user_mapping
+
         # Start with cached users as base (if provided)
         if cached_users:
             for user_id, user_data in cached_users.items():
-                display_name = user_data.get("user_real_name") or user_data.get("user_name") or user_id
-                self.user_mapping[user_id] = display_name
+                mapping[user_id] = user_data.get("user_real_name") or user_data.get("user_name") or user_id
 
-        # Overlay with message authors (fresher data)
-        def process_message(msg: Dict[str, Any]) -> None:
+        # Overlay with message authors (fresher data); the stack is kept
+        # reversed so messages pop in order, each followed by its replies
+        stack = messages[::-1]
+        while stack:
+            msg = stack.pop()
             user_id = msg.get("user_id")
             if user_id:
                 # Always update - message authors have fresher data
-                display_name = msg.get("user_real_name") or msg.get("user_name") or user_id
-                self.user_mapping[user_id] = display_name
+                mapping[user_id] = msg.get("user_real_name") or msg.get("user_name") or user_id
 
-            # Process replies recursively
-            for reply in msg.get("replies", []):
-                process_message(reply)
+            replies = msg.get("replies")
+            if replies:
+                stack.extend(replies[::-1])
 
-        for message in messages:
-            process_message(message)
+    def _ensure_user_mapping(self) -> None:
+        """Fold pending messages and cached users into user_mapping, if any"""
+        if self._pending_mapping is not None:
+            messages, cached_users = self._pending_mapping
+            self._pending_mapping = None
+            self._build_user_mapping(messages, cached_users=cached_users)
 
     def _resolve_mentions(self, text: str) -> str:
         """Resolve Slack user mentions from <@USER_ID> to @username
 
+        Results are memoized by raw text for the current format() call, since
+        the same texts and mentions recur heavily across a channel view.
+
         Args:
             text: Message text containing Slack mentions like <@U02JRGK9TCG>
 
@@ -599,17 +782,32 @@ class MessageViewFormatter:
         if not self.resolve_mentions or not text:
             return text
 
+        # Most texts mention nobody: a substring scan is far cheaper than
+        # hashing the text for the cache or running the regex
+        if "<@" not in text:
+            return text
+
+        resolved = self._mention_cache.get(text)
+        if resolved is not None:
+            return resolved
+
+        self._ensure_user_mapping()
+
+        # Nothing to resolve against (no authors or cached users): every
+        # mention would be kept as-is, so skip the regex
+        if not self.user_mapping:
+            return text
+
+        get_name = self.user_mapping.get
+
         def replace_mention(match):
-            user_id = match.group(1)
-            if user_id in self.user_mapping:
-                return f"@{self.user_mapping[user_id]}"
-            else:
-                # Keep original if not found in mapping
-                return match.group(0)
+            name = get_name(match.group(1))
+            # Keep original if not found in mapping
+            return f"@{name}" if name is not None else match.group(0)
 
-        # Pattern: <@USER_ID> where USER_ID starts with U
-        pattern = r'<@(U[A-Z0-9]+)>'
-        return re.sub(pattern, replace_mention, text)
+        resolved = MENTION_PATTERN.sub(replace_mention, text)
+        self._mention_cache[text] = resolved
+        return resolved
 
     def _format_timestamp_short(self, timestamp_str: str) -> str:
         """Format timestamp to short readable format (HH:MM only)
@@ -620,15 +818,7 @@ class MessageViewFormatter:
         Returns:
             Formatted timestamp (e.g., "10:30")
         """
-        if not timestamp_str:
-            return "unknown"
-
-        try:
-            ts = timestamp_str.replace("Z", "+00:00")
-            dt = datetime.fromisoformat(ts)
-            return dt.strftime("%H:%M")
-        except (ValueError, AttributeError):
-            return timestamp_str[:5] if len(timestamp_str) >= 5 else timestamp_str
+        return _format_timestamp_short_cached(timestamp_str)
 
     def _format_timestamp(self, timestamp_str: str) -> str:
         """Format ISO timestamp to readable format with relative time
@@ -639,56 +829,4 @@ class MessageViewFormatter:
         Returns:
             Formatted timestamp with relative time (e.g., "2023-10-20 10:00 (2 days ago)")
         """
-        if not timestamp_str:
-            return "unknown time"
-
-        try:
-            # Handle both with and without Z suffix
-            ts = timestamp_str.replace("Z", "+00:00")
-            dt = datetime.fromisoformat(ts)
-
-            # Format absolute time
-            absolute_time = dt.strftime("%Y-%m-%d %H:%M")
-
-            # Calculate relative time
-            relative_time = self._get_relative_time(dt)
-
-            return f"{absolute_time} ({relative_time})"
-        except (ValueError, AttributeError):
-            # Fallback for malformed timestamps
-            return timestamp_str[:16] if len(timestamp_str) >= 16 else timestamp_str
-
-    def _get_relative_time(self, dt: datetime) -> str:
-        """Get human-readable relative time from datetime
-
-        Args:
-            dt: Datetime object to calculate relative time from
-
-        Returns:
-            Relative time string (e.g., "2 mins ago", "3 hours ago", "5 days ago")
-        """
-        now = datetime.now(dt.tzinfo) if dt.tzinfo else datetime.now()
-        diff = now - dt
-
-        seconds = diff.total_seconds()
-
-        if seconds < 60:
-            return "just now"
-        elif seconds < 3600:  # Less than 1 hour
-            mins = int(seconds / 60)
-            return f"{mins} min{'s' if mins != 1 else ''} ago"
-        elif seconds < 86400:  # Less than 1 day
-            hours = int(seconds / 3600)
-            return f"{hours} hour{'s' if hours != 1 else ''} ago"
-        elif seconds < 604800:  # Less than 1 week
-            days = int(seconds / 86400)
-            return f"{days} day{'s' if days != 1 else ''} ago"
-        elif seconds < 2592000:  # Less than 30 days
-            weeks = int(seconds / 604800)
-            return f"{weeks} week{'s' if weeks != 1 else ''} ago"
-        elif seconds < 31536000:  # Less than 1 year
-            months = int(seconds / 2592000)
-            return f"{months} month{'s' if months != 1 else ''} ago"
-        else:
-            years = int(seconds / 31536000)
-            return f"{years} year{'s' if years != 1 else ''} ago"
+        return _format_timestamp_cached(timestamp_str, self._now)
@@ -5,14 +5,18 @@ partitioned Parquet files for efficient columnar storage and querying.
 """
 
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Union
 import re
 
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
 from .slack_channels import SlackMessage, SlackChannel, JiraTicket
 
+# Partition dates must be YYYY-MM-DD
+DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}\Z")
+
 
 def _create_message_schema() -> pa.Schema:
     """Create PyArrow schema for Slack messages
@@ -119,12 +123,95 @@ def _create_jira_schema() -> pa.Schema:
     ])
 
 
+def _rows_to_table(rows: List[Dict[str, Any]], schema: pa.Schema) -> pa.Table:
+    """Build a PyArrow table from row dicts, one column at a time
+
+    Pivots the rows into a list per schema field so each column array is
+    built in a single pass, rather than dispatching on every row as
+    ``pa.Table.from_pylist`` does. Missing keys become nulls and keys not
+    in the schema are ignored, matching ``from_pylist``.
+
+    Args:
+        rows: Row dicts keyed by field name
+        schema: PyArrow schema for the table
+
+    Returns:
+        PyArrow table with the given schema
+    """
+    return pa.Table.from_pydict(
+        {name: [row.get(name) for row in rows] for name in schema.names},
+        schema=schema
+    )
+
+
+def _conform_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Select and cast a table's columns to match schema
+
+    Partitions written by older versions may lack newer fields; those are
+    filled with nulls, and columns not in the schema are dropped.
+
+    Args:
+        table: Table read from an existing partition
+        schema: PyArrow schema the result must have
+
+    Returns:
+        Table with exactly the given schema
+    """
+    if table.schema.equals(schema):
+        return table
+    columns = [
+        table[field.name].cast(field.type)
+        if field.name in table.column_names
+        else pa.nulls(table.num_rows, field.type)
+        for field in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _upsert_rows(
+    existing: Optional[pa.Table],
+    rows: List[Dict[str, Any]],
+    key: str,
+    schema: pa.Schema,
+    constants: Optional[Dict[str, Any]] = None
+) -> pa.Table:
+    """Merge row dicts into an existing table by primary key
+
+    Existing rows stay in Arrow: rows whose key appears in the new batch are
+    filtered out and the batch is appended, so only the new rows are ever
+    Python objects. Within the batch the last row per key wins.
+
+    Args:
+        existing: Table read from the partition, or None if there is none
+        rows: New row dicts (new values override existing on conflict)
+        key: Primary key column
+        schema: PyArrow schema for the table
+        constants: Optional column values shared by every new row, filled
+            as one column rather than set on each row dict
+
+    Returns:
+        Merged table sorted by key
+    """
+    table = _rows_to_table(list({row[key]: row for row in rows}.values()), schema)
+    for name, value in (constants or {}).items():
+        index = schema.get_field_index(name)
+        field = schema.field(index)
+        table = table.set_column(
+            index, field, pa.repeat(pa.scalar(value, type=field.type), table.num_rows)
+        )
+    if existing is not None and existing.num_rows:
+        existing = _conform_table(existing, schema)
+        replaced = pc.is_in(existing[key], value_set=table[key])
+        table = pa.concat_tables([existing.filter(pc.invert(replaced)), table])
+    return table.sort_by(key)
+
+
 class ParquetCache:
     """Cache Slack messages in Parquet format for efficient querying
 
     Features:
     - Partitioned by date and channel
-    - Columnar storage with PyArrow
+    - Columnar storage with PyArrow (zstd-compressed by default)
     - Overwrite mode (replaces existing partitions)
     - Automatic directory creation
 
@@ -137,15 +224,29 @@ class ParquetCache:
         'cache/raw/messages/dt=2023-10-18/channel=engineering/data.parquet'
     """
 
-    def __init__(self, base_path: str = "cache/raw"):
+    # Schemas are immutable, so they are built once and shared by all instances
+    MESSAGE_SCHEMA = _create_message_schema()
+    JIRA_SCHEMA = _create_jira_schema()
+
+    def __init__(
+        self,
+        base_path: str = "cache/raw",
+        compression: str = "zstd",
+        compression_level: Optional[int] = 3
+    ):
         """Initialize ParquetCache
 
         Args:
             base_path: Base directory for cache (default: "cache/raw")
+            compression: Parquet compression codec (default: "zstd")
+            compression_level: Codec level, or None for codecs without
+                levels such as "snappy" (default: 3)
         """
         self.base_path = base_path
-        self.message_schema = _create_message_schema()
-        self.jira_schema = _create_jira_schema()
+        self.compression = compression
+        self.compression_level = compression_level
+        self.message_schema = self.MESSAGE_SCHEMA
+        self.jira_schema = self.JIRA_SCHEMA
 
     def save_messages(
         self,
@@ -173,7 +274,7 @@ class ParquetCache:
             >>> path = cache.save_messages(messages, channel, "2023-10-18")
         """
         # Validate date format
-        if not re.match(r"^\d{4}-\d{2}-\d{2}$", date):
+        if not DATE_PATTERN.match(date):
             raise ValueError(f"Invalid date format: {date}. Expected YYYY-MM-DD")
 
         # Generate partition path
@@ -182,20 +283,16 @@ class ParquetCache:
         file_path = partition_dir / "data.parquet"
 
         # Ensure directory exists
-        self._ensure_directory_exists(str(partition_dir))
+        self._ensure_directory_exists(partition_dir)
 
         # Merge new messages with existing (upsert semantics)
         # This implements exactly-once delivery and idempotent caching
         table = self._merge_messages(file_path, messages, self.message_schema)
 
         # Write merged table to Parquet
-        pq.write_table(
-            table,
-            str(file_path),
-            compression='snappy'
-        )
+        self._write_table(table, file_path)
 
-        return str(file_path).replace("\\", "/")
+        return file_path.as_posix()
 
     def save_jira_tickets(
         self,
@@ -220,7 +317,7 @@ class ParquetCache:
             >>> path = cache.save_jira_tickets(tickets, "2023-10-18")
         """
         # Validate date format
-        if not re.match(r"^\d{4}-\d{2}-\d{2}$", date):
+        if not DATE_PATTERN.match(date):
             raise ValueError(f"Invalid date format: {date}. Expected YYYY-MM-DD")
 
         # Generate partition path: cache/raw/jira/dt=2025-10-20/data.parquet
@@ -228,19 +325,15 @@ class ParquetCache:
         file_path = partition_dir / "data.parquet"
 
         # Ensure directory exists
-        self._ensure_directory_exists(str(partition_dir))
+        self._ensure_directory_exists(partition_dir)
 
         # Merge new tickets with existing (upsert semantics)
         table = self._merge_jira_tickets(file_path, tickets, self.jira_schema)
 
         # Write merged table to Parquet
-        pq.write_table(
-            table,
-            str(file_path),
-            compression='snappy'
-        )
+        self._write_table(table, file_path)
 
-        return str(file_path).replace("\\", "/")
+        return file_path.as_posix()
 
     def _merge_messages(
         self,
@@ -264,49 +357,20 @@ class ParquetCache:
         Returns:
             Merged PyArrow table with deduplicated messages
         """
-        # 1. Load existing data (if file exists)
-        existing_messages = {}
+        # 1. Load existing partition (if file exists); its rows stay in Arrow
+        existing_table = None
         if file_path.exists():
             try:
                 existing_table = pq.read_table(str(file_path))
-                existing_data = existing_table.to_pydict()
-
-                # Index by message_id for O(1) lookup
-                for i in range(existing_table.num_rows):
-                    msg_id = existing_data['message_id'][i]
-                    # Reconstruct row as dict
-                    existing_messages[msg_id] = {
-                        col: existing_data[col][i]
-                        for col in existing_data.keys()
-                    }
             except Exception as e:
                 # Log warning but continue (file might be corrupt)
                 print(f"Warning: Could not read existing partition {file_path}: {e}")
                 print("Creating new partition...")
 
-        # 2. Convert new messages to dict, indexed by message_id
-        new_messages_dict = {}
-        for msg in new_messages:
-            msg_dict = msg.to_parquet_dict()
-            msg_id = msg_dict['message_id']
-            new_messages_dict[msg_id] = msg_dict
-
-        # 3. Merge: existing + new (new overwrites on conflict - upsert semantics)
-        # Use dict unpacking for explicit merge order (new values override existing)
-        merged = {**existing_messages, **new_messages_dict}
-
-        # 4. Convert back to list and sort by message_id for deterministic ordering
-        merged_list = list(merged.values())
-        merged_list.sort(key=lambda x: x['message_id'])
-
-        # 5. Create PyArrow table
-        if merged_list:
-            table = pa.Table.from_pylist(merged_list, schema=schema)
-        else:
-            # Empty result - create empty table with schema
-            table = pa.Table.from_pylist([], schema=schema)
-
-        return table
+        # 2. Upsert by message_id (new overwrites on conflict) and sort by
+        # message_id for deterministic ordering
+        new_rows = [msg.to_parquet_dict() for msg in new_messages]
+        return _upsert_rows(existing_table, new_rows, "message_id", schema)
 
     def _merge_jira_tickets(
         self,
@@ -326,49 +390,43 @@ class ParquetCache:
         """
         from datetime import datetime
 
-        # 1. Load existing data (if file exists)
-        existing_tickets = {}
+        # 1. Load existing partition (if file exists); its rows stay in Arrow
+        existing_table = None
         if file_path.exists():
             try:
                 existing_table = pq.read_table(str(file_path))
-                existing_data = existing_table.to_pydict()
-
-                # Index by ticket_id
-                for i in range(existing_table.num_rows):
-                    ticket_id = existing_data['ticket_id'][i]
-                    existing_tickets[ticket_id] = {
-                        col: existing_data[col][i]
-                        for col in existing_data.keys()
-                    }
             except Exception as e:
                 print(f"Warning: Could not read existing JIRA partition {file_path}: {e}")
                 print("Creating new partition...")
 
         # 2. Convert new tickets to dict
-        new_tickets_dict = {}
-        now = datetime.utcnow()
-        for ticket in new_tickets:
-            ticket_dict = ticket.to_parquet_dict()
-            ticket_dict['cached_at'] = now
-            ticket_id = ticket_dict['ticket_id']
-            new_tickets_dict[ticket_id] = ticket_dict
-
-        # 3. Merge (upsert semantics) - new values override existing
-        merged = {**existing_tickets, **new_tickets_dict}
-
-        # 4. Convert back to list and sort
-        merged_list = list(merged.values())
-        merged_list.sort(key=lambda x: x['ticket_id'])
-
-        # 5. Create PyArrow table
-        if merged_list:
-            table = pa.Table.from_pylist(merged_list, schema=schema)
-        else:
-            table = pa.Table.from_pylist([], schema=schema)
+        new_rows = [ticket.to_parquet_dict() for ticket in new_tickets]
+
+        # 3. Upsert by ticket_id (new values override existing) and sort;
+        # the whole batch shares one fetch time
+        return _upsert_rows(
+            existing_table,
+            new_rows,
+            "ticket_id",
+            schema,
+            constants={"cached_at": datetime.utcnow()}
+        )
 
-        return table
+    def _write_table(self, table: pa.Table, file_path: Path):
+        """Write a table to Parquet with the configured compression
+
+        Args:
+            table: PyArrow table to write
+            file_path: Destination Parquet file
+        """
+        pq.write_table(
+            table,
+            str(file_path),
+            compression=self.compression,
+            compression_level=self.compression_level
+        )
 
-    def _ensure_directory_exists(self, path: str):
+    def _ensure_directory_exists(self, path: Union[str, Path]):
         """Create directory if it doesn't exist
 
         Args:
@@ -401,14 +459,16 @@ class ParquetCache:
 
         partitions = []
         for file_path in parquet_files:
-            # Get partition info
+            # Row count comes from the footer and size from the open handle,
+            # so no column data is read and the path is resolved once
+            path = str(file_path)
             try:
-                table = pq.read_table(str(file_path))
-                partitions.append({
-                    "path": str(file_path),
-                    "row_count": table.num_rows,
-                    "size_bytes": file_path.stat().st_size,
-                })
+                with pa.OSFile(path) as f:
+                    partitions.append({
+                        "path": path,
+                        "row_count": pq.read_metadata(f).num_rows,
+                        "size_bytes": f.size(),
+                    })
             except Exception:
                 # Skip files that can't be read
                 continue
@@ -5,9 +5,11 @@ Parquet format (dt=YYYY-MM-DD/channel=name).
 """
 
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 from datetime import datetime, timedelta
-import pyarrow.parquet as pq
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 
 
 class ParquetMessageReader:
@@ -39,7 +41,8 @@ class ParquetMessageReader:
         self,
         channel: str,
         date: str,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Read messages from a single channel/date partition
 
@@ -47,6 +50,7 @@ class ParquetMessageReader:
             channel: Channel name (e.g., "engineering")
             date: Date in YYYY-MM-DD format
             filters: Optional field filters (e.g., {"is_thread_parent": True})
+            columns: Optional fields to return (default: all)
 
         Returns:
             List of message dicts, sorted chronologically
@@ -67,27 +71,16 @@ class ParquetMessageReader:
         if not parquet_file.exists():
             return []
 
-        # Read Parquet file
-        table = pq.read_table(str(parquet_file))
-
-        # Convert to list of dicts
-        messages = table.to_pylist()
-
-        # Apply filters if provided
-        if filters:
-            messages = self._apply_filters(messages, filters)
-
-        # Sort chronologically
-        messages.sort(key=lambda m: m["timestamp"])
-
-        return messages
+        dataset = ds.dataset(str(parquet_file), format="parquet")
+        return self._scan(dataset, filters, columns).to_pylist()
 
     def read_channel_range(
         self,
         channel: str,
         start_date: str,
         end_date: str,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Read messages from a channel across multiple dates
 
@@ -96,6 +89,7 @@ class ParquetMessageReader:
             start_date: Start date in YYYY-MM-DD format (inclusive)
             end_date: End date in YYYY-MM-DD format (inclusive)
             filters: Optional field filters
+            columns: Optional fields to return (default: all)
 
         Returns:
             List of message dicts from all dates, sorted chronologically
@@ -108,23 +102,8 @@ class ParquetMessageReader:
             ...     "2023-10-20"
             ... )
         """
-        # Generate list of dates in range
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
-
-        all_messages = []
-        current = start
-
-        while current <= end:
-            date_str = current.strftime("%Y-%m-%d")
-            messages = self.read_channel(channel, date_str, filters)
-            all_messages.extend(messages)
-            current += timedelta(days=1)
-
-        # Sort chronologically across all partitions
-        all_messages.sort(key=lambda m: m["timestamp"])
-
-        return all_messages
+        table = self._read_channel_range_table(channel, start_date, end_date, filters, columns)
+        return table.to_pylist() if table is not None else []
 
     def read_all_channels(
         self,
@@ -145,36 +124,8 @@ class ParquetMessageReader:
             >>> reader = ParquetMessageReader()
             >>> messages = reader.read_all_channels("2023-10-20")
         """
-        date_partition = self.messages_path / f"dt={date}"
-
-        # Return empty list if date partition doesn't exist
-        if not date_partition.exists():
-            return []
-
-        all_messages = []
-
-        # Find all channel partitions for this date
-        for channel_dir in date_partition.iterdir():
-            if not channel_dir.is_dir():
-                continue
-
-            # Extract channel name from directory name (channel=engineering)
-            if channel_dir.name.startswith("channel="):
-                channel_name = channel_dir.name.replace("channel=", "")
-
-                # Read messages from this channel
-                messages = self.read_channel(channel_name, date, filters)
-
-                # Add channel_name to each message
-                for msg in messages:
-                    msg["channel_name"] = channel_name
-
-                all_messages.extend(messages)
-
-        # Sort chronologically across all channels
-        all_messages.sort(key=lambda m: m["timestamp"])
-
-        return all_messages
+        table = self._read_all_channels_table([date], filters)
+        return table.to_pylist() if table is not None else []
 
     def find_messages_with_ticket(
         self,
@@ -204,49 +155,224 @@ class ParquetMessageReader:
         """
         if channel:
             # Search specific channel
-            messages = self.read_channel_range(channel, start_date, end_date)
+            table = self._read_channel_range_table(channel, start_date, end_date)
         else:
-            # Search all channels
-            start = datetime.strptime(start_date, "%Y-%m-%d")
-            end = datetime.strptime(end_date, "%Y-%m-%d")
+            # Search all channels and dates in one scan
+            table = self._read_all_channels_table(self._date_range(start_date, end_date))
+
+        if table is None:
+            return []
+
+        # Filter for messages containing the ticket in Arrow; rows are
+        # already in date order and only matches become dicts
+        return self._rows_with_ticket(table, ticket_id).to_pylist()
+
+    def _read_channel_range_table(
+        self,
+        channel: str,
+        start_date: str,
+        end_date: str,
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None
+    ) -> Optional[pa.Table]:
+        """Read a channel's partitions across dates as one sorted table
+
+        Args:
+            channel: Channel name
+            start_date: Start date in YYYY-MM-DD format (inclusive)
+            end_date: End date in YYYY-MM-DD format (inclusive)
+            filters: Optional field filters
+            columns: Optional fields to return (default: all)
+
+        Returns:
+            Table of messages sorted by timestamp, or None if no partition exists
+        """
+        # Partition files for each date in range that has one
+        files = []
+
+        for date_str in self._date_range(start_date, end_date):
+            parquet_file = self.messages_path / f"dt={date_str}" / f"channel={channel}" / "data.parquet"
+            if parquet_file.exists():
+                files.append(str(parquet_file))
+
+        if not files:
+            return None
+
+        # One scan over all partitions, sorted chronologically across them
+        dataset = self._dataset(files)
+        return self._scan(dataset, filters, columns)
+
+    def _read_all_channels_table(
+        self,
+        dates: List[str],
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[pa.Table]:
+        """Read every channel's partitions for the given dates as one table
+
+        Args:
+            dates: Dates in YYYY-MM-DD format, in the order to return them
+            filters: Optional field filters
 
-            all_messages = []
-            current = start
+        Returns:
+            Table of messages with a channel_name column, sorted by date and
+            then timestamp, or None if no partition exists
+        """
+        # Find all channel partitions for these dates (dt=.../channel=engineering)
+        files = []
 
-            while current <= end:
-                date_str = current.strftime("%Y-%m-%d")
-                messages = self.read_all_channels(date_str)
-                all_messages.extend(messages)
-                current += timedelta(days=1)
+        for date in dates:
+            date_partition = self.messages_path / f"dt={date}"
+            if not date_partition.exists():
+                continue
+            files.extend(
+                str(channel_dir / "data.parquet")
+                for channel_dir in date_partition.iterdir()
+                if channel_dir.is_dir()
+                and channel_dir.name.startswith("channel=")
+                and (channel_dir / "data.parquet").exists()
+            )
+
+        if not files:
+            return None
+
+        # One scan over all partitions; dt and the channel name come from each
+        # file's directories, and the channel is returned as 'channel_name'
+        dataset = self._dataset(
+            files,
+            partitioning=ds.HivePartitioning(
+                pa.schema([("dt", pa.string()), ("channel", pa.string())]),
+                segment_encoding="none"
+            ),
+            partition_base_dir=str(self.messages_path)
+        )
+        table = self._scan(dataset, filters, sort_keys=("dt", "timestamp")).drop_columns(["dt"])
+
+        return table.rename_columns(
+            ["channel_name" if name == "channel" else name for name in table.column_names]
+        )
+
+    @staticmethod
+    def _dataset(files: List[str], **options: Any) -> ds.Dataset:
+        """Open partition files as one dataset with a schema covering them all
+
+        A plain dataset takes its schema from the first file, so columns
+        added after an older partition was cached would be dropped from
+        every row. The schema is unified over all files instead; columns a
+        partition lacks read as null.
 
-            messages = all_messages
+        Args:
+            files: Partition file paths
+            **options: Extra ds.dataset options (e.g. partitioning)
 
-        # Filter for messages containing the ticket
-        filtered = [
-            msg for msg in messages
-            if ticket_id in msg.get("jira_tickets", [])
+        Returns:
+            Dataset over the files
+        """
+        dataset = ds.dataset(files, format="parquet", **options)
+        schema = pa.unify_schemas(
+            [dataset.schema, *(fragment.physical_schema for fragment in dataset.get_fragments())]
+        )
+        return dataset.replace_schema(schema)
+
+    @staticmethod
+    def _date_range(start_date: str, end_date: str) -> List[str]:
+        """List the dates from start_date to end_date (inclusive), YYYY-MM-DD"""
+        start = datetime.strptime(start_date, "%Y-%m-%d")
+        end = datetime.strptime(end_date, "%Y-%m-%d")
+        return [
+            (start + timedelta(days=offset)).strftime("%Y-%m-%d")
+            for offset in range((end - start).days + 1)
         ]
 
-        # Already sorted chronologically
-        return filtered
+    @staticmethod
+    def _rows_with_ticket(table: pa.Table, ticket_id: str) -> pa.Table:
+        """Keep the rows whose jira_tickets list contains ticket_id
 
-    def _apply_filters(
+        Matches against the flattened list values, so no row is turned into
+        a Python object; row order is preserved.
+
+        Args:
+            table: Message table with a jira_tickets list column
+            ticket_id: JIRA ticket ID to look for
+
+        Returns:
+            Table with only the matching rows, empty if no partition read
+            has a jira_tickets column
+        """
+        if "jira_tickets" not in table.column_names:
+            return table.slice(0, 0)
+
+        tickets = table["jira_tickets"].combine_chunks()
+        matches = pc.equal(pc.list_flatten(tickets), ticket_id)
+        rows = pc.unique(pc.filter(pc.list_parent_indices(tickets), matches))
+        return table.take(rows)
+
+    def _scan(
         self,
-        messages: List[Dict[str, Any]],
+        dataset: ds.Dataset,
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        sort_keys: Sequence[str] = ("timestamp",)
+    ) -> pa.Table:
+        """Read a dataset of partitions, sorted chronologically
+
+        Filters and projection are pushed into the scan, so row groups whose
+        statistics rule out the filters, and unrequested columns, are
+        skipped. Filtering and sorting stay in Arrow; callers convert only
+        the kept rows to dicts.
+
+        Args:
+            dataset: Dataset over one or more partition files
+            filters: Optional field filters
+            columns: Optional fields to return (default: all)
+            sort_keys: Columns to sort by, ascending (default: timestamp)
+
+        Returns:
+            Table of matching messages sorted by sort_keys
+        """
+        expression = self._filter_expression(dataset.schema, filters) if filters else None
+
+        # Sorting needs the timestamp even when the caller did not ask for it
+        read_columns = columns
+        if columns is not None and "timestamp" not in columns:
+            read_columns = [*columns, "timestamp"]
+
+        # Stable sort, like list.sort
+        table = dataset.to_table(columns=read_columns, filter=expression).sort_by(
+            [(key, "ascending") for key in sort_keys]
+        )
+        if read_columns is not columns:
+            table = table.select(columns)
+
+        return table
+
+    def _filter_expression(
+        self,
+        schema: pa.Schema,
         filters: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """Apply filters to message list
+    ) -> Optional[pc.Expression]:
+        """Translate field filters into a scan expression
+
+        Matches dict semantics: a missing field reads as None, and a None
+        filter value selects nulls.
 
         Args:
-            messages: List of message dicts
+            schema: Schema of the partition being read
             filters: Dict of field:value filters
 
         Returns:
-            Filtered message list
+            Expression selecting the matching rows, or None to keep all rows
         """
-        filtered = messages
+        expression = None
 
         for field, value in filters.items():
-            filtered = [msg for msg in filtered if msg.get(field) == value]
-
-        return filtered
+            if field not in schema.names:
+                if value is None:
+                    continue
+                return pc.scalar(False)
+            if value is None:
+                condition = pc.field(field).is_null()
+            else:
+                condition = pc.field(field) == value
+            expression = condition if expression is None else expression & condition
+
+        return expression
@@ -30,6 +30,8 @@ class ParquetUserReader:
         """
         self.base_path = Path(base_path)
         self.users_file = self.base_path / "users.parquet"
+        self._users_cache: Optional[Dict[str, Dict[str, Any]]] = None  # parsed users file
+        self._users_cache_key = None  # (mtime_ns, size) of the file the cache was built from
 
     def read_users(self) -> Dict[str, Dict[str, Any]]:
         """Read all cached users
@@ -46,9 +48,26 @@ class ParquetUserReader:
             >>> users['U123']['user_real_name']
             'Alice Chen'
         """
-        if not self.users_file.exists():
+        return dict(self._load_users())
+
+    def _load_users(self) -> Dict[str, Dict[str, Any]]:
+        """Return the parsed users, re-reading the file only when it changes
+
+        The mapping is shared between calls, so callers must not mutate it;
+        read_users() hands out a copy.
+
+        Returns:
+            Dictionary mapping user_id to user data dict
+        """
+        try:
+            stat = self.users_file.stat()
+        except OSError:
             return {}
 
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        if self._users_cache is not None and cache_key == self._users_cache_key:
+            return self._users_cache
+
         try:
             # Read Parquet file
             table = pq.read_table(str(self.users_file))
@@ -57,25 +76,38 @@ class ParquetUserReader:
             users_dict = {}
             data = table.to_pydict()
 
+            # Optional columns may be missing from older caches; fill each
+            # once rather than per row
+            user_ids = data['user_id']
+            missing = [None] * len(user_ids)
+
             # Build mapping: user_id -> {user_name, user_real_name, ...}
-            for i in range(len(data['user_id'])):
-                user_id = data['user_id'][i]
+            for user_id, user_name, user_real_name, user_email, is_bot, cached_at in zip(
+                user_ids,
+                data.get('user_name', missing),
+                data.get('user_real_name', missing),
+                data.get('user_email', missing),
+                data.get('is_bot', [False] * len(user_ids)),
+                data.get('cached_at', missing),
+            ):
                 users_dict[user_id] = {
                     'user_id': user_id,
-                    'user_name': data.get('user_name', [None] * len(data['user_id']))[i],
-                    'user_real_name': data.get('user_real_name', [None] * len(data['user_id']))[i],
-                    'user_email': data.get('user_email', [None] * len(data['user_id']))[i],
-                    'is_bot': data.get('is_bot', [False] * len(data['user_id']))[i],
-                    'cached_at': data.get('cached_at', [None] * len(data['user_id']))[i]
+                    'user_name': user_name,
+                    'user_real_name': user_real_name,
+                    'user_email': user_email,
+                    'is_bot': is_bot,
+                    'cached_at': cached_at
                 }
 
-            return users_dict
-
         except Exception as e:
             # Return empty dict on error, don't fail the view generation
             print(f"Warning: Could not read user cache: {e}")
             return {}
 
+        self._users_cache = users_dict
+        self._users_cache_key = cache_key
+        return users_dict
+
     def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get a single user by ID
 
@@ -91,8 +123,7 @@ class ParquetUserReader:
             >>> user['user_real_name']
             'Alice Chen'
         """
-        users = self.read_users()
-        return users.get(user_id)
+        return self._load_users().get(user_id)
 
     def cache_exists(self) -> bool:
         """Check if user cache file exists
@@ -118,7 +149,16 @@ class ParquetUserReader:
         Returns:
             Number of users in cache, or 0 if cache doesn't exist
         """
-        return len(self.read_users())
+        if not self.users_file.exists():
+            return 0
+
+        # The cache holds one row per user_id, so the footer's row count is
+        # the user count; no column data is decoded
+        try:
+            return pq.read_metadata(str(self.users_file)).num_rows
+        except Exception as e:
+            print(f"Warning: Could not read user cache: {e}")
+            return 0
 
     def find_user_by_name(self, username: str) -> Optional[str]:
         """Find user_id by matching username (fuzzy)
@@ -139,25 +179,27 @@ class ParquetUserReader:
             >>> reader.find_user_by_name("Tarun Katial")
             'U01234ABCD'
         """
-        users = self.read_users()
+        users = self._load_users()
         username_lower = username.lower()
 
-        # First pass: exact match on user_name
-        for user_id, user_data in users.items():
-            user_name = user_data.get('user_name', '')
-            if user_name and user_name.lower() == username_lower:
-                return user_id
+        # One pass in priority order: an exact user_name match wins at once;
+        # otherwise the first partial user_name match, then the first partial
+        # user_real_name match
+        name_match = None
+        real_name_match = None
 
-        # Second pass: partial match on user_name
         for user_id, user_data in users.items():
-            user_name = user_data.get('user_name', '')
-            if user_name and username_lower in user_name.lower():
-                return user_id
-
-        # Third pass: partial match on user_real_name
-        for user_id, user_data in users.items():
-            real_name = user_data.get('user_real_name', '')
-            if real_name and username_lower in real_name.lower():
-                return user_id
-
-        return None
+            user_name = user_data.get('user_name')
+            if user_name:
+                user_name_lower = user_name.lower()
+                if user_name_lower == username_lower:
+                    return user_id
+                if name_match is None and username_lower in user_name_lower:
+                    name_match = user_id
+
+            if real_name_match is None:
+                real_name = user_data.get('user_real_name')
+                if real_name and username_lower in real_name.lower():
+                    real_name_match = user_id
+
+        return name_match if name_match is not None else real_name_match
@@ -1,6 +1,6 @@
 """Utilities for Parquet file partitioning and path management"""
 
-from datetime import datetime
+from datetime import date
 from pathlib import Path
 
 
@@ -17,11 +17,9 @@ def extract_date_from_slack_ts(timestamp: str) -> str:
         >>> extract_date_from_slack_ts("1697654321.123456")
         '2023-10-18'
     """
-    # Convert Slack timestamp to datetime
-    dt = datetime.fromtimestamp(float(timestamp))
-
-    # Return date in YYYY-MM-DD format
-    return dt.strftime("%Y-%m-%d")
+    # Convert Slack timestamp to a local date; isoformat() is YYYY-MM-DD
+    # without going through strftime's format parsing
+    return date.fromtimestamp(float(timestamp)).isoformat()
 
 
 def generate_partition_key(
@@ -67,7 +65,7 @@ def get_partition_path(base_path: str, partition_key: str) -> str:
     path = Path(base_path) / partition_key / "data.parquet"
 
     # Return as string with forward slashes
-    return str(path).replace("\\", "/")
+    return path.as_posix()
 
 
 def get_partition_directory(base_path: str, partition_key: str) -> str:
@@ -85,4 +83,4 @@ def get_partition_directory(base_path: str, partition_key: str) -> str:
         'cache/raw/messages/dt=2023-10-18/channel=engineering'
     """
     path = Path(base_path) / partition_key
-    return str(path).replace("\\", "/")
+    return path.as_posix()
@@ -2,11 +2,13 @@
 
 from .chain import ChainProcessor
 from .processors import OpenAIProcessor
+from .response_cache import ResponseCache
 from .schemas import ProcessingContext, ProcessingStep, AnalysisResult
 
 __all__ = [
     "ChainProcessor",
     "OpenAIProcessor",
+    "ResponseCache",
     "ProcessingContext",
     "ProcessingStep",
     "AnalysisResult",
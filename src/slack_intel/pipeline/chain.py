@@ -1,12 +1,20 @@
 """Main chain-of-thought processor for Slack message analysis"""
 
+import asyncio
+import re
 import time
-from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
-from .processors import OpenAIProcessor
+from .processors import OpenAIProcessor, PromptTemplates
+from .response_cache import ResponseCache
 from .schemas import ProcessingContext, ProcessingStep, AnalysisResult
 
+# Zero-width match where a formatted message starts ("💬 MESSAGE #1", "  💬 Alice at ...")
+MESSAGE_START = re.compile(r"^(?=[ \t]*💬 )", re.MULTILINE)
+
+# Texts at least this long are tokenized in a worker thread on the async path
+OFFLOAD_TOKENIZE_CHARS = 50_000
+
 
 class ChainProcessor:
     """
@@ -17,13 +25,14 @@ class ChainProcessor:
     (Future: Can add more steps like sentiment analysis, entity extraction, etc.)
     """
 
-    def __init__(self, openai_api_key: str):
+    def __init__(self, openai_api_key: str, cache: Optional[ResponseCache] = None):
         """Initialize chain processor
 
         Args:
             openai_api_key: OpenAI API key for LLM processing
+            cache: Optional ResponseCache for reusing summaries of identical requests
         """
-        self.openai_processor = OpenAIProcessor(openai_api_key)
+        self.openai_processor = OpenAIProcessor(openai_api_key, cache=cache)
 
     def analyze_messages(
         self,
@@ -38,7 +47,8 @@ class ChainProcessor:
         view_type: str = "single_channel",
         channels: list = None,
         org_context: dict = None,
-        custom_instructions: str = None
+        custom_instructions: str = None,
+        on_chunk: Optional[Callable[[str], None]] = None
     ) -> AnalysisResult:
         """
         Run the complete chain-of-thought analysis on Slack messages
@@ -50,17 +60,18 @@ class ChainProcessor:
             model: OpenAI model to use (gpt-4o or gpt-5)
             temperature: Sampling temperature (not used for GPT-5)
             max_tokens: Maximum tokens in response (not used for GPT-5)
-            stream: Whether to stream the response (not supported by GPT-5)
+            stream: Whether to stream the response
             reasoning_effort: Reasoning effort for GPT-5 (low, medium, high)
             view_type: Type of view ("single_channel", "multi_channel", "user_timeline")
             channels: List of channel names (for multi-channel and user timeline views)
             org_context: Optional organizational context (stakeholders, channel descriptions)
             custom_instructions: Optional custom analysis instructions (overrides default prompts)
+            on_chunk: Optional callable invoked with each chunk of the summary as it arrives
 
         Returns:
             Complete analysis result with summary and metrics
         """
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
 
         # Initialize processing context
         context = ProcessingContext(
@@ -80,14 +91,127 @@ class ChainProcessor:
             view_type=view_type,
             channels=channels,
             org_context=org_context,
-            custom_instructions=custom_instructions
+            custom_instructions=custom_instructions,
+            on_chunk=on_chunk
         )
 
-        # Calculate total time
-        total_time = (datetime.now() - start_time).total_seconds()
+        # Calculate total time (monotonic clock, immune to wall-clock changes)
+        total_time = (time.perf_counter_ns() - start_ns) / 1e9
+
+        return self._build_result(context, total_time)
 
-        # Create final result
-        result = AnalysisResult(
+    async def aanalyze_messages(
+        self,
+        message_content: str,
+        channel_name: str,
+        date_range: str,
+        model: str = "gpt-5",
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        stream: bool = True,
+        reasoning_effort: str = "medium",
+        view_type: str = "single_channel",
+        channels: list = None,
+        org_context: dict = None,
+        custom_instructions: str = None,
+        on_chunk: Optional[Callable[[str], None]] = None,
+        chunk_tokens: Optional[int] = None,
+        max_concurrency: int = 4
+    ) -> AnalysisResult:
+        """
+        Async version of analyze_messages
+
+        Takes the same arguments as analyze_messages; the LLM call goes
+        through the AsyncOpenAI client so other analyses can run meanwhile.
+
+        With chunk_tokens set, message content larger than that is split on
+        message boundaries into parts of about chunk_tokens tokens. The parts
+        are summarized concurrently and their summaries combined by one final
+        call, so very long periods neither overflow the context window nor
+        wait on a single long request.
+
+        Args:
+            chunk_tokens: Optional token budget per part (default: never split)
+            max_concurrency: Maximum part summaries in flight at once (default: 4)
+
+        Returns:
+            Complete analysis result with summary and metrics
+        """
+        start_ns = time.perf_counter_ns()
+
+        # Initialize processing context
+        context = ProcessingContext(
+            channel_name=channel_name,
+            date_range=date_range,
+            message_content=message_content,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+
+        # Step 1: Process messages with LLM
+        await self._astep_1_process_messages(
+            context,
+            stream=stream,
+            reasoning_effort=reasoning_effort,
+            view_type=view_type,
+            channels=channels,
+            org_context=org_context,
+            custom_instructions=custom_instructions,
+            on_chunk=on_chunk,
+            chunk_tokens=chunk_tokens,
+            max_concurrency=max_concurrency
+        )
+
+        # Calculate total time (monotonic clock, immune to wall-clock changes)
+        total_time = (time.perf_counter_ns() - start_ns) / 1e9
+
+        return self._build_result(context, total_time)
+
+    async def aanalyze_messages_batch(
+        self,
+        jobs: List[Dict[str, Any]],
+        max_concurrency: int = 4
+    ) -> List[Union[AnalysisResult, Exception]]:
+        """
+        Run several analyses concurrently (e.g. one per channel or user)
+
+        Wall time is close to the slowest analysis rather than the sum of
+        all of them, since each one mostly waits on the API.
+
+        Args:
+            jobs: Keyword arguments for aanalyze_messages, one dict per analysis
+            max_concurrency: Maximum analyses in flight at once, to stay
+                             within OpenAI rate limits (default: 4)
+
+        Returns:
+            One entry per job, in job order: the AnalysisResult, or the
+            exception the job raised (a failure does not cancel the others)
+
+        Example:
+            >>> processor = ChainProcessor(api_key)
+            >>> jobs = [
+            ...     {"message_content": view, "channel_name": name, "date_range": "2025-10-20"}
+            ...     for name, view in views.items()
+            ... ]
+            >>> results = asyncio.run(processor.aanalyze_messages_batch(jobs))
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(job: Dict[str, Any]) -> AnalysisResult:
+            """Run a single analysis with concurrency limiting"""
+            async with semaphore:
+                return await self.aanalyze_messages(**job)
+
+        return await asyncio.gather(
+            *[run_one(job) for job in jobs],
+            return_exceptions=True
+        )
+
+    @staticmethod
+    def _build_result(context: ProcessingContext, total_time: float) -> AnalysisResult:
+        """Create the final result from a processed context"""
+        return AnalysisResult(
             channel_name=context.channel_name,
             date_range=context.date_range,
             summary=context.summary or "",
@@ -96,8 +220,6 @@ class ChainProcessor:
             model_used=context.model
         )
 
-        return result
-
     def _step_1_process_messages(
         self,
         context: ProcessingContext,
@@ -106,7 +228,8 @@ class ChainProcessor:
         view_type: str = "single_channel",
         channels: list = None,
         org_context: dict = None,
-        custom_instructions: str = None
+        custom_instructions: str = None,
+        on_chunk: Optional[Callable[[str], None]] = None
     ) -> None:
         """
         Step 1: Process messages with LLM to generate summary
@@ -119,12 +242,13 @@ class ChainProcessor:
             channels: List of channel names (for multi-channel and user timeline views)
             org_context: Optional organizational context (stakeholders, channel descriptions)
             custom_instructions: Optional custom analysis instructions (overrides default prompts)
+            on_chunk: Optional callable invoked with each chunk of the summary as it arrives
         """
-        step_start = time.time()
+        step_start_ns = time.perf_counter_ns()
 
         try:
             # Estimate input size
-            input_size = self.openai_processor.estimate_tokens(context.message_content)
+            input_size = self.openai_processor.estimate_tokens(context.message_content, context.model)
 
             # Generate summary
             summary_chunks = []
@@ -143,32 +267,233 @@ class ChainProcessor:
                 custom_instructions=custom_instructions
             ):
                 summary_chunks.append(chunk)
+                if on_chunk:
+                    on_chunk(chunk)
 
             context.summary = "".join(summary_chunks)
-            duration = time.time() - step_start
-
-            # Record processing step
-            output_size = self.openai_processor.estimate_tokens(context.summary)
-            context.processing_steps.append(
-                ProcessingStep(
-                    step_name="process_messages",
-                    input_data=f"Messages (~{input_size} tokens)",
-                    output_data=f"Summary (~{output_size} tokens)",
-                    processing_time=duration,
-                    success=True
-                )
-            )
+            duration = (time.perf_counter_ns() - step_start_ns) / 1e9
+            output_size = self.openai_processor.estimate_tokens(context.summary, context.model)
+            self._record_process_step(context, input_size, output_size, duration)
 
         except Exception as e:
-            duration = time.time() - step_start
-            context.processing_steps.append(
-                ProcessingStep(
-                    step_name="process_messages",
-                    input_data=f"Messages",
-                    output_data="",
-                    processing_time=duration,
-                    success=False,
-                    error_message=str(e)
+            self._record_failed_process_step(context, e, (time.perf_counter_ns() - step_start_ns) / 1e9)
+            raise Exception(f"Failed to process messages: {e}")
+
+    async def _astep_1_process_messages(
+        self,
+        context: ProcessingContext,
+        stream: bool = True,
+        reasoning_effort: str = "medium",
+        view_type: str = "single_channel",
+        channels: list = None,
+        org_context: dict = None,
+        custom_instructions: str = None,
+        on_chunk: Optional[Callable[[str], None]] = None,
+        chunk_tokens: Optional[int] = None,
+        max_concurrency: int = 4
+    ) -> None:
+        """
+        Async version of _step_1_process_messages
+
+        Takes the same arguments, plus chunk_tokens and max_concurrency (see
+        aanalyze_messages). Each part summary is recorded as its own
+        process_messages_part_N step, followed by a reduce_summaries step.
+        """
+        summary_options = dict(
+            stream=stream,
+            reasoning_effort=reasoning_effort,
+            view_type=view_type,
+            channels=channels,
+            org_context=org_context,
+            custom_instructions=custom_instructions
+        )
+
+        if chunk_tokens is None:
+            parts = [context.message_content]
+        elif len(context.message_content) < OFFLOAD_TOKENIZE_CHARS:
+            parts = self._partition(context.message_content, chunk_tokens, context.model)
+        else:
+            parts = await asyncio.to_thread(
+                self._partition, context.message_content, chunk_tokens, context.model
+            )
+
+        if len(parts) == 1:
+            context.summary = await self._agenerate_step(
+                context, context.message_content, "process_messages", on_chunk, **summary_options
+            )
+            return
+
+        # Map: summarize the parts concurrently
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def summarize_part(part_number: int, part: str) -> str:
+            """Summarize one part with concurrency limiting"""
+            async with semaphore:
+                return await self._agenerate_step(
+                    context, part, f"process_messages_part_{part_number}", None, **summary_options
                 )
+
+        # A failed part cancels the parts still running, so they stop
+        # spending tokens on a summary that will not be used
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [
+                    group.create_task(summarize_part(i, part))
+                    for i, part in enumerate(parts, 1)
+                ]
+        except ExceptionGroup as errors:
+            raise errors.exceptions[0]
+
+        partial_summaries = [task.result() for task in tasks]
+
+        # Reduce: combine the partial summaries in one final call
+        combined = "\n\n".join(
+            f"=== Part {i} of {len(parts)} ===\n{summary}"
+            for i, summary in enumerate(partial_summaries, 1)
+        )
+        context.summary = await self._agenerate_step(
+            context,
+            PromptTemplates.REDUCE_SUMMARIES.format(
+                part_count=len(parts),
+                partial_summaries=combined
+            ),
+            "reduce_summaries",
+            on_chunk,
+            **summary_options
+        )
+
+    async def _agenerate_step(
+        self,
+        context: ProcessingContext,
+        message_content: str,
+        step_name: str,
+        on_chunk: Optional[Callable[[str], None]] = None,
+        **summary_options
+    ) -> str:
+        """Generate one summary of message_content and record it as a step
+
+        Args:
+            context: Processing context (channel, dates and model settings)
+            message_content: Content to summarize
+            step_name: Name of the recorded ProcessingStep
+            on_chunk: Optional callable invoked with each chunk as it arrives
+            **summary_options: Further agenerate_summary arguments
+
+        Returns:
+            Generated summary text
+        """
+        step_start_ns = time.perf_counter_ns()
+
+        try:
+            # Estimate input size
+            input_size = await self._aestimate_tokens(message_content, context.model)
+
+            # Generate summary
+            summary_chunks = []
+            async for chunk in self.openai_processor.agenerate_summary(
+                message_content=message_content,
+                channel_name=context.channel_name,
+                date_range=context.date_range,
+                model=context.model,
+                temperature=context.temperature,
+                max_tokens=context.max_tokens,
+                **summary_options
+            ):
+                summary_chunks.append(chunk)
+                if on_chunk:
+                    on_chunk(chunk)
+
+            summary = "".join(summary_chunks)
+            duration = (time.perf_counter_ns() - step_start_ns) / 1e9
+            output_size = await self._aestimate_tokens(summary, context.model)
+            self._record_process_step(context, input_size, output_size, duration, step_name)
+            return summary
+
+        except Exception as e:
+            self._record_failed_process_step(
+                context, e, (time.perf_counter_ns() - step_start_ns) / 1e9, step_name
             )
             raise Exception(f"Failed to process messages: {e}")
+
+    async def _aestimate_tokens(self, text: str, model: str) -> int:
+        """estimate_tokens, run in a worker thread for large texts
+
+        Counting a long view with tiktoken takes milliseconds; in a thread
+        the event loop keeps serving other in-flight analyses meanwhile.
+        Short texts are counted inline, where a thread hop would cost more.
+        """
+        if len(text) < OFFLOAD_TOKENIZE_CHARS:
+            return self.openai_processor.estimate_tokens(text, model)
+        return await asyncio.to_thread(self.openai_processor.estimate_tokens, text, model)
+
+    def _partition(self, message_content: str, target_tokens: int, model: str) -> List[str]:
+        """Split message content into parts of about target_tokens tokens
+
+        Splits only where a message starts, so a message stays whole with
+        its thread replies; a single larger message becomes its own part.
+        The view header goes with the first part and the footer with the last.
+
+        Args:
+            message_content: Formatted message content from view command
+            target_tokens: Token budget per part
+            model: Model whose tokenizer to count with
+
+        Returns:
+            Parts in order; joined they equal message_content
+        """
+        parts = []
+        current = []
+        current_tokens = 0
+
+        for block in MESSAGE_START.split(message_content):
+            if not block:
+                continue
+            block_tokens = self.openai_processor.estimate_tokens(block, model)
+            if current and current_tokens + block_tokens > target_tokens:
+                parts.append("".join(current))
+                current = []
+                current_tokens = 0
+            current.append(block)
+            current_tokens += block_tokens
+
+        if current or not parts:
+            parts.append("".join(current))
+        return parts
+
+    @staticmethod
+    def _record_process_step(
+        context: ProcessingContext,
+        input_size: int,
+        output_size: int,
+        duration: float,
+        step_name: str = "process_messages"
+    ) -> None:
+        """Record a successful summary step on the context"""
+        context.processing_steps.append(
+            ProcessingStep(
+                step_name=step_name,
+                input_data=f"Messages (~{input_size} tokens)",
+                output_data=f"Summary (~{output_size} tokens)",
+                processing_time=duration,
+                success=True
+            )
+        )
+
+    @staticmethod
+    def _record_failed_process_step(
+        context: ProcessingContext,
+        error: Exception,
+        duration: float,
+        step_name: str = "process_messages"
+    ) -> None:
+        """Record a failed summary step on the context"""
+        context.processing_steps.append(
+            ProcessingStep(
+                step_name=step_name,
+                input_data="Messages",
+                output_data="",
+                processing_time=duration,
+                success=False,
+                error_message=str(error)
+            )
+        )
@@ -1,24 +1,36 @@
 """LLM processors for message analysis"""
 
 import time
-from typing import Iterator, Optional
-from openai import OpenAI
+from typing import AsyncIterator, Iterator, NamedTuple, Optional
+from openai import AsyncOpenAI, OpenAI
+
+from .response_cache import ResponseCache
+
+# System context sent ahead of every prompt
+SYSTEM_PROMPT = (
+    "You are an AI assistant specialized in analyzing Slack conversations "
+    "and extracting actionable insights."
+)
 
 
 class PromptTemplates:
     """Prompt templates for different processing stages with attention flow awareness
 
     Templates are split into:
-    - FOUNDATION_* : Data context (channel, date, messages) - always included
+    - FOUNDATION_* : Data context (channel, date, messages) - always included,
+                     made of a static ROLE_* line and a DATA_* template
     - INSTRUCTIONS_*: Analysis instructions - can be customized
     - SUMMARIZE_*   : Full templates (foundation + instructions) - for backward compatibility
     """
 
     # === FOUNDATIONS (Data Context) ===
+    # Each foundation is a static role line plus the DATA_* template. Prompts
+    # are sent as role + instructions + data, so everything ahead of the data
+    # is byte-identical across calls and eligible for provider prompt caching.
 
-    FOUNDATION_MESSAGES = """You are analyzing Slack channel messages to provide actionable insights.
+    ROLE_MESSAGES = "You are analyzing Slack channel messages to provide actionable insights."
 
-Channel: {channel_name}
+    DATA_MESSAGES = """Channel: {channel_name}
 Date Range: {date_range}
 
 {org_context}
@@ -26,9 +38,9 @@ Date Range: {date_range}
 Messages:
 {message_content}"""
 
-    FOUNDATION_USER_TIMELINE = """You are analyzing a Slack user's timeline to understand their contributions and communication patterns.
+    ROLE_USER_TIMELINE = "You are analyzing a Slack user's timeline to understand their contributions and communication patterns."
 
-User: {channel_name}
+    DATA_USER_TIMELINE = """User: {channel_name}
 Date Range: {date_range}
 Channels: {channels}
 
@@ -37,9 +49,9 @@ Channels: {channels}
 Messages:
 {message_content}"""
 
-    FOUNDATION_MULTI_CHANNEL = """You are analyzing messages across multiple Slack channels to map organizational attention flow.
+    ROLE_MULTI_CHANNEL = "You are analyzing messages across multiple Slack channels to map organizational attention flow."
 
-Channels: {channels}
+    DATA_MULTI_CHANNEL = """Channels: {channels}
 Date Range: {date_range}
 
 {org_context}
@@ -47,6 +59,10 @@ Date Range: {date_range}
 Messages:
 {message_content}"""
 
+    FOUNDATION_MESSAGES = ROLE_MESSAGES + "\n\n" + DATA_MESSAGES
+    FOUNDATION_USER_TIMELINE = ROLE_USER_TIMELINE + "\n\n" + DATA_USER_TIMELINE
+    FOUNDATION_MULTI_CHANNEL = ROLE_MULTI_CHANNEL + "\n\n" + DATA_MULTI_CHANNEL
+
     # === INSTRUCTIONS (Analysis Framework) ===
 
     INSTRUCTIONS_MESSAGES = """Please provide a comprehensive summary using the Attention Flow framework:
@@ -179,6 +195,14 @@ Identify the top 3-5 topics/initiatives consuming organizational energy:
 
 Focus on synthesizing cross-channel patterns, ranking attention by leadership involvement and engagement intensity."""
 
+    # === REDUCE (Combining partial analyses) ===
+    # Used as the message content of the final call when a long period is
+    # analyzed in parts (ChainProcessor.aanalyze_messages with chunk_tokens)
+
+    REDUCE_SUMMARIES = """These messages were too long to analyze in one pass, so they were split into {part_count} consecutive parts and each part was analyzed separately. Combine the partial analyses below into one analysis of the whole period: merge topics that span several parts, keep the latest state of each, and do not refer to the parts themselves.
+
+{partial_summaries}"""
+
     # === FULL TEMPLATES (Backward Compatibility) ===
     # These combine foundation + instructions for existing code
 
@@ -187,18 +211,81 @@ Focus on synthesizing cross-channel patterns, ranking attention by leadership in
     SUMMARIZE_MULTI_CHANNEL = FOUNDATION_MULTI_CHANNEL + "\n\n" + INSTRUCTIONS_MULTI_CHANNEL
 
 
+class ViewPrompt(NamedTuple):
+    """Prompt templates for one view type"""
+    role: str
+    data: str
+    instructions: str
+
+
+# view_type -> its prompt templates
+VIEW_PROMPTS = {
+    "single_channel": ViewPrompt(
+        PromptTemplates.ROLE_MESSAGES,
+        PromptTemplates.DATA_MESSAGES,
+        PromptTemplates.INSTRUCTIONS_MESSAGES,
+    ),
+    "multi_channel": ViewPrompt(
+        PromptTemplates.ROLE_MULTI_CHANNEL,
+        PromptTemplates.DATA_MULTI_CHANNEL,
+        PromptTemplates.INSTRUCTIONS_MULTI_CHANNEL,
+    ),
+    "user_timeline": ViewPrompt(
+        PromptTemplates.ROLE_USER_TIMELINE,
+        PromptTemplates.DATA_USER_TIMELINE,
+        PromptTemplates.INSTRUCTIONS_USER_TIMELINE,
+    ),
+}
+
+
+class _Completion:
+    """Whether a summary request ended with a complete response
+
+    Set by _request_summary as the response arrives; only complete,
+    non-empty summaries are written to the response cache.
+    """
+    __slots__ = ("complete",)
+
+    def __init__(self) -> None:
+        self.complete = False
+
+
 class OpenAIProcessor:
     """
     Processes text content using OpenAI's API with streaming support
     """
 
-    def __init__(self, api_key: str):
+    # Retries for rate limits (429), 5xx, timeouts and connection errors. The
+    # SDK backs off exponentially with jitter and honors Retry-After headers.
+    MAX_RETRIES = 5
+
+    def __init__(
+        self,
+        api_key: str,
+        cache: Optional[ResponseCache] = None,
+        max_retries: int = MAX_RETRIES
+    ):
         """Initialize OpenAI processor
 
         Args:
             api_key: OpenAI API key
+            cache: Optional ResponseCache; identical requests are then
+                   answered from it instead of calling the API again
+            max_retries: Retries per request on transient API errors (default: 5)
         """
-        self.client = OpenAI(api_key=api_key)
+        self.client = OpenAI(api_key=api_key, max_retries=max_retries)
+        self.cache = cache
+        self._api_key = api_key
+        self._max_retries = max_retries
+        self._async_client: Optional[AsyncOpenAI] = None
+        self._encodings = {}  # model -> tiktoken encoding (None without tiktoken)
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """AsyncOpenAI client for agenerate_summary, created on first use"""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(api_key=self._api_key, max_retries=self._max_retries)
+        return self._async_client
 
     def generate_summary(
         self,
@@ -225,7 +312,7 @@ class OpenAIProcessor:
             model: OpenAI model to use (default: gpt-4o, or gpt-5)
             temperature: Sampling temperature (not supported by GPT-5)
             max_tokens: Maximum tokens in response (not supported by GPT-5)
-            stream: Whether to stream the response (not supported by GPT-5)
+            stream: Whether to stream the response
             reasoning_effort: Reasoning effort for GPT-5 (low, medium, high)
             view_type: Type of view ("single_channel", "multi_channel", "user_timeline")
             channels: List of channel names (for multi-channel and user timeline views)
@@ -235,116 +322,312 @@ class OpenAIProcessor:
         Yields:
             Chunks of generated text if streaming, full text otherwise
         """
-        # Format organizational context if provided
-        org_context_str = ""
-        if org_context:
-            org_context_str = self._format_org_context(org_context, view_type, channels)
+        prompt = self._build_prompt(
+            message_content, channel_name, date_range,
+            view_type, channels, org_context, custom_instructions
+        )
+        request = self._build_request(model, prompt, temperature, max_tokens, stream, reasoning_effort)
+
+        if self.cache is None:
+            yield from self._request_summary(request)
+            return
+
+        # An identical earlier request is answered from the cache
+        cache_key = self.cache.make_key(self._cache_identity(request))
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        completion = _Completion()
+        chunks = []
+        for chunk in self._request_summary(request, completion):
+            chunks.append(chunk)
+            yield chunk
+
+        # Empty or cut-short responses would be replayed until they expire
+        summary = "".join(chunks)
+        if completion.complete and summary:
+            self.cache.set(cache_key, model, summary)
+
+    async def agenerate_summary(
+        self,
+        message_content: str,
+        channel_name: str,
+        date_range: str,
+        model: str = "gpt-5",
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        stream: bool = True,
+        reasoning_effort: str = "medium",
+        view_type: str = "single_channel",
+        channels: list = None,
+        org_context: dict = None,
+        custom_instructions: str = None
+    ) -> AsyncIterator[str]:
+        """
+        Async version of generate_summary using the AsyncOpenAI client
 
-        # Build prompt: foundation + (custom instructions OR default instructions)
-        if view_type == "user_timeline":
-            foundation = PromptTemplates.FOUNDATION_USER_TIMELINE
-            default_instructions = PromptTemplates.INSTRUCTIONS_USER_TIMELINE
-            channels_str = ", ".join(channels) if channels else "multiple channels"
-            foundation_formatted = foundation.format(
-                channel_name=channel_name,
-                date_range=date_range,
-                channels=channels_str,
-                org_context=org_context_str,
-                message_content=message_content
-            )
-        elif view_type == "multi_channel":
-            foundation = PromptTemplates.FOUNDATION_MULTI_CHANNEL
-            default_instructions = PromptTemplates.INSTRUCTIONS_MULTI_CHANNEL
-            channels_str = ", ".join(channels) if channels else "multiple channels"
-            foundation_formatted = foundation.format(
-                channels=channels_str,
-                date_range=date_range,
-                org_context=org_context_str,
-                message_content=message_content
-            )
-        else:  # single_channel
-            foundation = PromptTemplates.FOUNDATION_MESSAGES
-            default_instructions = PromptTemplates.INSTRUCTIONS_MESSAGES
-            foundation_formatted = foundation.format(
-                channel_name=channel_name,
-                date_range=date_range,
-                org_context=org_context_str,
-                message_content=message_content
-            )
+        Takes the same arguments as generate_summary. While a request waits
+        on the API the event loop is free, so summaries for several channels
+        can be in flight at once (see ChainProcessor.aanalyze_messages_batch).
 
-        # Use custom instructions if provided, otherwise use default
-        instructions = custom_instructions if custom_instructions else default_instructions
-        prompt = foundation_formatted + "\n\n" + instructions
+        Yields:
+            Chunks of generated text if streaming, full text otherwise
+        """
+        prompt = self._build_prompt(
+            message_content, channel_name, date_range,
+            view_type, channels, org_context, custom_instructions
+        )
+        request = self._build_request(model, prompt, temperature, max_tokens, stream, reasoning_effort)
+
+        if self.cache is None:
+            async for chunk in self._arequest_summary(request):
+                yield chunk
+            return
+
+        # An identical earlier request is answered from the cache
+        cache_key = self.cache.make_key(self._cache_identity(request))
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        completion = _Completion()
+        chunks = []
+        async for chunk in self._arequest_summary(request, completion):
+            chunks.append(chunk)
+            yield chunk
+
+        # Empty or cut-short responses would be replayed until they expire
+        summary = "".join(chunks)
+        if completion.complete and summary:
+            self.cache.set(cache_key, model, summary)
+
+    def _request_summary(self, request: dict, completion: Optional[_Completion] = None) -> Iterator[str]:
+        """Send a request built by _build_request and yield the generated text
+
+        Args:
+            request: Arguments for responses.create or chat.completions.create
+            completion: Optional flag set once the model reports a finished response
+
+        Yields:
+            Chunks of generated text if streaming, full text otherwise
+        """
+        if completion is None:
+            completion = _Completion()
 
         try:
             # GPT-5 uses the new Responses API
-            if model.startswith("gpt-5") or model == "gpt-5":
-                # Build full prompt with system context for GPT-5
-                full_prompt = (
-                    "You are an AI assistant specialized in analyzing Slack conversations "
-                    "and extracting actionable insights.\n\n"
-                    f"{prompt}"
-                )
-
-                # GPT-5 Responses API - no streaming, no temperature, no max_tokens
-                response = self.client.responses.create(
-                    model=model,
-                    input=full_prompt,
-                    reasoning={"effort": reasoning_effort}
-                )
-
-                # GPT-5 returns full response at once
-                output_content = response.output_text
-                yield output_content
+            if self._uses_responses_api(request["model"]):
+                response = self.client.responses.create(**request)
+
+                if request["stream"]:
+                    # Streamed as events; text deltas carry output, and a
+                    # failed or cut-short generation raises
+                    for event in response:
+                        if event.type == "response.output_text.delta":
+                            yield event.delta
+                        elif event.type == "response.completed":
+                            completion.complete = True
+                        else:
+                            self._check_stream_event(event)
+                else:
+                    completion.complete = response.status == "completed"
+                    yield response.output_text
 
             # GPT-4 and earlier use Chat Completions API
             else:
-                if stream:
-                    # Streaming response
-                    response = self.client.chat.completions.create(
-                        model=model,
-                        messages=[
-                            {
-                                "role": "system",
-                                "content": "You are an AI assistant specialized in analyzing Slack conversations and extracting actionable insights."
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ],
-                        temperature=temperature,
-                        max_tokens=max_tokens,
-                        stream=True
-                    )
+                response = self.client.chat.completions.create(**request)
 
+                if request["stream"]:
                     for chunk in response:
-                        if chunk.choices[0].delta.content:
-                            yield chunk.choices[0].delta.content
+                        choice = chunk.choices[0]
+                        if choice.delta.content:
+                            yield choice.delta.content
+                        if choice.finish_reason is not None:
+                            completion.complete = choice.finish_reason == "stop"
                 else:
-                    # Non-streaming response
-                    response = self.client.chat.completions.create(
-                        model=model,
-                        messages=[
-                            {
-                                "role": "system",
-                                "content": "You are an AI assistant specialized in analyzing Slack conversations and extracting actionable insights."
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ],
-                        temperature=temperature,
-                        max_tokens=max_tokens,
-                        stream=False
-                    )
+                    completion.complete = response.choices[0].finish_reason == "stop"
+                    yield response.choices[0].message.content
 
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {str(e)}")
+
+    async def _arequest_summary(self, request: dict, completion: Optional[_Completion] = None) -> AsyncIterator[str]:
+        """Async version of _request_summary using the AsyncOpenAI client"""
+        if completion is None:
+            completion = _Completion()
+
+        try:
+            # GPT-5 uses the new Responses API
+            if self._uses_responses_api(request["model"]):
+                response = await self.async_client.responses.create(**request)
+
+                if request["stream"]:
+                    # Streamed as events; text deltas carry output, and a
+                    # failed or cut-short generation raises
+                    async for event in response:
+                        if event.type == "response.output_text.delta":
+                            yield event.delta
+                        elif event.type == "response.completed":
+                            completion.complete = True
+                        else:
+                            self._check_stream_event(event)
+                else:
+                    completion.complete = response.status == "completed"
+                    yield response.output_text
+
+            # GPT-4 and earlier use Chat Completions API
+            else:
+                response = await self.async_client.chat.completions.create(**request)
+
+                if request["stream"]:
+                    async for chunk in response:
+                        choice = chunk.choices[0]
+                        if choice.delta.content:
+                            yield choice.delta.content
+                        if choice.finish_reason is not None:
+                            completion.complete = choice.finish_reason == "stop"
+                else:
+                    completion.complete = response.choices[0].finish_reason == "stop"
                     yield response.choices[0].message.content
 
         except Exception as e:
             raise Exception(f"OpenAI API error: {str(e)}")
 
+    def _build_prompt(
+        self,
+        message_content: str,
+        channel_name: str,
+        date_range: str,
+        view_type: str = "single_channel",
+        channels: list = None,
+        org_context: dict = None,
+        custom_instructions: str = None
+    ) -> str:
+        """Build the prompt: role + (custom instructions OR default instructions) + data
+
+        Args:
+            message_content: Formatted message content from view command
+            channel_name: Name of the Slack channel or user
+            date_range: Date range of messages
+            view_type: Type of view ("single_channel", "multi_channel", "user_timeline")
+            channels: List of channel names (for multi-channel and user timeline views)
+            org_context: Optional organizational context (stakeholders, channel descriptions)
+            custom_instructions: Optional custom analysis instructions (overrides default prompts)
+
+        Returns:
+            Prompt text for the model
+        """
+        # Format organizational context if provided
+        org_context_str = ""
+        if org_context:
+            org_context_str = self._format_org_context(org_context, view_type, channels)
+
+        # Unknown view types get the single-channel prompt
+        view = VIEW_PROMPTS.get(view_type, VIEW_PROMPTS["single_channel"])
+
+        # Templates without a {channels} field ignore it
+        channels_str = ", ".join(channels) if channels else "multiple channels"
+        data = view.data.format(
+            channel_name=channel_name,
+            date_range=date_range,
+            channels=channels_str,
+            org_context=org_context_str,
+            message_content=message_content
+        )
+
+        # Use custom instructions if provided, otherwise use default
+        instructions = custom_instructions.strip() if custom_instructions else view.instructions
+
+        # Static part first (role + instructions), then the per-call data, so
+        # repeated requests share a prefix the provider can cache
+        return view.role + "\n\n" + instructions + "\n\n" + data
+
+    def _build_request(
+        self,
+        model: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        stream: bool,
+        reasoning_effort: str
+    ) -> dict:
+        """Arguments for the API call that serves model"""
+        if self._uses_responses_api(model):
+            return self._responses_request(model, prompt, reasoning_effort, stream)
+        return self._chat_request(model, prompt, temperature, max_tokens, stream)
+
+    @staticmethod
+    def _cache_identity(request: dict) -> dict:
+        """The request fields that determine the response (streaming does not)"""
+        return {key: value for key, value in request.items() if key != "stream"}
+
+    @staticmethod
+    def _check_stream_event(event) -> None:
+        """Raise if a Responses API stream event reports a failed or incomplete response
+
+        Without this a failed or truncated generation would end the stream
+        with an empty or partial summary and no error.
+        """
+        if event.type == "response.failed":
+            error = event.response.error
+            raise RuntimeError(f"Response failed: {error.message if error else 'unknown error'}")
+        if event.type == "response.incomplete":
+            details = event.response.incomplete_details
+            raise RuntimeError(f"Response incomplete: {details.reason if details else 'unknown reason'}")
+        if event.type == "error":
+            raise RuntimeError(f"Stream error: {event.message}")
+
+    @staticmethod
+    def _uses_responses_api(model: str) -> bool:
+        """GPT-5 models go through the Responses API, older ones through Chat Completions"""
+        return model.startswith("gpt-5")
+
+    @staticmethod
+    def _responses_request(model: str, prompt: str, reasoning_effort: str, stream: bool) -> dict:
+        """Arguments for responses.create (GPT-5)"""
+        # Build full prompt with system context for GPT-5
+        full_prompt = (
+            f"{SYSTEM_PROMPT}\n\n"
+            f"{prompt}"
+        )
+
+        # GPT-5 Responses API - no temperature, no max_tokens
+        return {
+            "model": model,
+            "input": full_prompt,
+            "reasoning": {"effort": reasoning_effort},
+            "stream": stream,
+        }
+
+    @staticmethod
+    def _chat_request(
+        model: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        stream: bool
+    ) -> dict:
+        """Arguments for chat.completions.create (GPT-4 and earlier)"""
+        return {
+            "model": model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": stream,
+        }
+
     def _format_org_context(self, org_context: dict, view_type: str, channels: list = None) -> str:
         """Format organizational context for prompt injection
 
@@ -403,15 +686,37 @@ class OpenAIProcessor:
 
         return "\n".join(lines) if lines else ""
 
-    def estimate_tokens(self, text: str) -> int:
+    def estimate_tokens(self, text: str, model: str = "gpt-5") -> int:
         """
-        Rough estimate of token count for text
-        Using approximation: 1 token ≈ 4 characters
+        Count the tokens in text for model
+
+        Uses the model's BPE encoding from tiktoken when it is installed,
+        otherwise approximates 1 token ≈ 4 characters.
 
         Args:
-            text: Text to estimate
+            text: Text to count
+            model: Model whose tokenizer to use (default: gpt-5)
 
         Returns:
-            Estimated token count
+            Token count (estimated if tiktoken is unavailable)
         """
-        return len(text) // 4
+        encoding = self._get_encoding(model)
+        if encoding is None:
+            return len(text) // 4
+        return len(encoding.encode_ordinary(text))
+
+    def _get_encoding(self, model: str):
+        """tiktoken encoding for model, cached per model; None without tiktoken"""
+        if model not in self._encodings:
+            try:
+                import tiktoken
+            except ImportError:
+                encoding = None
+            else:
+                try:
+                    encoding = tiktoken.encoding_for_model(model)
+                except KeyError:
+                    # Model newer than the installed tiktoken: current OpenAI encoding
+                    encoding = tiktoken.get_encoding("o200k_base")
+            self._encodings[model] = encoding
+        return self._encodings[model]
@@ -0,0 +1,101 @@
+"""Exact-match cache of LLM responses"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of generated summaries, keyed by request
+
+    A key is the SHA-256 of the full API request (model, prompt and
+    sampling settings), so only a byte-identical request is answered from
+    the cache. Re-analyzing the same channel and date range with unchanged
+    messages then costs no API call.
+
+    Example:
+        >>> cache = ResponseCache("cache/llm_responses.db", ttl_seconds=86400)
+        >>> processor = ChainProcessor(api_key, cache=cache)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = "cache/llm_responses.db",
+        ttl_seconds: Optional[float] = None
+    ):
+        """Initialize response cache
+
+        Args:
+            path: SQLite database file (created if missing)
+            ttl_seconds: Entries older than this are ignored (default: never expire)
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key BLOB PRIMARY KEY, model TEXT, created_at REAL, summary TEXT)"
+            )
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> bytes:
+        """Hash an API request into a cache key
+
+        Args:
+            request: JSON-serializable request arguments
+
+        Returns:
+            32-byte SHA-256 digest
+        """
+        payload = json.dumps(request, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        """Look up a cached summary
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            The cached summary, or None if missing or expired
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT summary, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        summary, created_at = row
+        if self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds:
+            return None
+        return summary
+
+    def set(self, key: bytes, model: str, summary: str) -> None:
+        """Store a summary, replacing any earlier entry for the key
+
+        Args:
+            key: Key from make_key
+            model: Model that generated the summary
+            summary: Generated summary text
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, created_at, summary) "
+                "VALUES (?, ?, ?, ?)",
+                (key, model, time.time(), summary)
+            )
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self._conn.close()
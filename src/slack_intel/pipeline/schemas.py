@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProcessingStep:
     """Record of a single processing step in the pipeline"""
     step_name: str
@@ -15,8 +15,19 @@ class ProcessingStep:
     success: bool
     error_message: Optional[str] = None
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "step_name": self.step_name,
+            "input_data": self.input_data,
+            "output_data": self.output_data,
+            "processing_time": self.processing_time,
+            "success": self.success,
+            "error_message": self.error_message,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingContext:
     """Context that flows through the processing pipeline"""
 
@@ -38,7 +49,7 @@ class ProcessingContext:
     created_at: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnalysisResult:
     """Complete result of the LLM processing pipeline"""
 
@@ -51,7 +62,7 @@ class AnalysisResult:
 
     # Processing metrics
     processing_steps: List[ProcessingStep]
-    total_processing_time: float
+    total_processing_time: float  # Elapsed seconds, from a monotonic clock
 
     # Metadata
     model_used: str
@@ -66,15 +77,5 @@ class AnalysisResult:
             "model_used": self.model_used,
             "total_processing_time": self.total_processing_time,
             "timestamp": self.timestamp.isoformat(),
-            "processing_steps": [
-                {
-                    "step_name": step.step_name,
-                    "input_data": step.input_data,
-                    "output_data": step.output_data,
-                    "processing_time": step.processing_time,
-                    "success": step.success,
-                    "error_message": step.error_message,
-                }
-                for step in self.processing_steps
-            ],
+            "processing_steps": [step.to_dict() for step in self.processing_steps],
         }
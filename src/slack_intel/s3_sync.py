@@ -2,14 +2,95 @@
 
 This module provides S3 sync functionality using s3fs (pure Python, no AWS CLI).
 Implements custom incremental sync logic based on file size and modification time.
+Uploads are dispatched through a bounded thread pool sharing one boto3 client,
+or, with the optional aioboto3 package, through a single asyncio event loop.
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional, Pattern
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import hashlib
+import json
+import os
+import re
+import stat
 import time
 
 
+# Default number of concurrent uploads (also sizes the HTTP connection pool)
+DEFAULT_MAX_WORKERS = 32
+
+# Multipart tuning: files above the threshold are split into parts uploaded
+# in parallel (8-16 MiB parts is the usual AWS recommendation)
+DEFAULT_MULTIPART_THRESHOLD = 64 * 1024 * 1024
+DEFAULT_MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+DEFAULT_MULTIPART_CONCURRENCY = 16
+
+# Local manifest of (size, mtime_ns, etag) per synced file, stored in the sync root
+MANIFEST_FILENAME = ".sync-manifest"
+
+
+def build_transfer_config(multipart_chunksize: int = DEFAULT_MULTIPART_CHUNKSIZE):
+    """Build the boto3 TransferConfig used for sync uploads
+
+    Args:
+        multipart_chunksize: Part size in bytes for files over the multipart threshold
+
+    Returns:
+        TransferConfig preferring the awscrt-backed client; boto3 falls back
+        to its classic transfer manager when awscrt is missing or too old
+    """
+    from boto3.s3.transfer import TransferConfig
+
+    return TransferConfig(
+        multipart_threshold=DEFAULT_MULTIPART_THRESHOLD,
+        multipart_chunksize=multipart_chunksize,
+        max_concurrency=DEFAULT_MULTIPART_CONCURRENCY,
+        use_threads=True,
+        preferred_transfer_client="crt"
+    )
+
+
+def _compile_include_pattern(pattern: str) -> Pattern[str]:
+    """Compile a glob pattern to a regex over relative POSIX keys
+
+    Supports the subset used for sync includes: "*" and "?" within one path
+    segment and a "**/" prefix matching any number of directories, so
+    "**/*.parquet" selects parquet files at any depth, as Path.glob would.
+    """
+    parts = []
+    for token in re.split(r"(\*\*/|\*|\?)", pattern):
+        if token == "**/":
+            parts.append("(?:.*/)?")
+        elif token == "*":
+            parts.append("[^/]*")
+        elif token == "?":
+            parts.append("[^/]")
+        else:
+            parts.append(re.escape(token))
+    return re.compile("".join(parts) + r"\Z")
+
+
+def _scan_files(root: Path) -> Iterator[tuple[str, str, os.stat_result]]:
+    """Yield (relative_key, path, stat) for every regular file under root
+
+    Walks with os.scandir so file types come from the directory entries, and
+    each file is stat'ed exactly once. Keys use forward slashes for S3.
+    Symlinked directories are not descended into.
+    """
+    stack = [("", os.fspath(root))]
+    while stack:
+        key_prefix, dir_path = stack.pop()
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((f"{key_prefix}{entry.name}/", entry.path))
+                elif entry.is_file():
+                    yield f"{key_prefix}{entry.name}", entry.path, entry.stat()
+
+
 @dataclass
 class SyncResult:
     """Result of an S3 sync operation"""
@@ -58,7 +139,10 @@ class S3Syncer:
         bucket: str,
         prefix: str = "",
         region: Optional[str] = None,
-        aws_profile: Optional[str] = None
+        aws_profile: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        s3_client=None,
+        transfer_config=None
     ):
         """Initialize S3 syncer
 
@@ -67,11 +151,18 @@ class S3Syncer:
             prefix: Optional prefix for all S3 keys (e.g., "production/")
             region: AWS region (defaults to boto3 default region)
             aws_profile: AWS profile name (supports SSO profiles)
+            max_workers: Number of concurrent upload threads
+            s3_client: Optional pre-built boto3 S3 client (defaults to one
+                       created from the syncer's session)
+            transfer_config: Optional boto3 TransferConfig for multipart
+                             uploads (defaults to build_transfer_config())
         """
         import s3fs
         import boto3
+        from botocore.config import Config
 
         self.bucket = bucket
+        self.max_workers = max_workers
         self.prefix = prefix.rstrip("/")
         if self.prefix:
             self.prefix += "/"
@@ -90,6 +181,22 @@ class S3Syncer:
 
         # Store session for verification
         self.session = boto3.Session(**session_kwargs)
+        self._session_kwargs = session_kwargs
+
+        # Large files are uploaded as concurrent multipart byte ranges, by the
+        # native CRT client when awscrt is installed
+        self.transfer_config = transfer_config or build_transfer_config()
+
+        # Single client shared by all upload threads (boto3 clients are
+        # thread-safe); pool sized so every worker, plus one file's worth of
+        # multipart part uploads, gets its own connection
+        self.client = s3_client or self.session.client(
+            "s3",
+            config=Config(
+                max_pool_connections=max_workers + self.transfer_config.max_concurrency,
+                retries={"max_attempts": 10, "mode": "adaptive"}
+            )
+        )
 
         # Initialize s3fs filesystem
         self.fs = s3fs.S3FileSystem(**storage_options)
@@ -139,6 +246,17 @@ class S3Syncer:
                     f"Error: {e}"
                 )
 
+    def _get_s3_key(self, relative_path: str = "") -> str:
+        """Build S3 object key with prefix (no bucket)
+
+        Args:
+            relative_path: Relative path from sync root
+
+        Returns:
+            S3 key like "prefix/path/file.parquet"
+        """
+        return f"{self.prefix}{relative_path}".lstrip("/")
+
     def _get_s3_path(self, relative_path: str = "") -> str:
         """Build full S3 path with bucket and prefix
 
@@ -148,27 +266,283 @@ class S3Syncer:
         Returns:
             Full S3 path like "my-bucket/prefix/path/file.parquet"
         """
-        s3_key = f"{self.prefix}{relative_path}".lstrip("/")
-        return f"{self.bucket}/{s3_key}"
+        return f"{self.bucket}/{self._get_s3_key(relative_path)}"
+
+    def _list_remote(self) -> dict[str, dict]:
+        """List all remote objects under the syncer's prefix
+
+        Uses paginated ListObjectsV2 (1000 keys per request) instead of a
+        request per file, and returns size/ETag straight from the listing.
+
+        Returns:
+            Dict mapping relative key to {'size', 'etag', 'mtime'}
+        """
+        paginator = self.client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=self.bucket,
+            Prefix=self.prefix,
+            PaginationConfig={"PageSize": 1000}
+        )
+
+        remote = {}
+        prefix_len = len(self.prefix)
+        for page in pages:
+            for obj in page.get("Contents", []):
+                remote[obj["Key"][prefix_len:]] = {
+                    "size": obj["Size"],
+                    "etag": obj["ETag"].strip('"'),
+                    "mtime": obj.get("LastModified")
+                }
+
+        return remote
+
+    def _delete_keys(self, relative_keys: list[str]) -> int:
+        """Delete remote objects in batches of up to 1000 keys per request
+
+        Args:
+            relative_keys: Keys relative to the syncer's prefix
+
+        Returns:
+            Number of objects deleted
+        """
+        deleted = 0
+        for start in range(0, len(relative_keys), 1000):
+            batch = relative_keys[start:start + 1000]
+            self.client.delete_objects(
+                Bucket=self.bucket,
+                Delete={
+                    "Objects": [{"Key": self._get_s3_key(key)} for key in batch],
+                    "Quiet": True
+                }
+            )
+            deleted += len(batch)
+
+        return deleted
+
+    def _manifest_destination(self) -> str:
+        """S3 URI the manifest entries were recorded against"""
+        return f"s3://{self.bucket}/{self.prefix}"
+
+    def _load_manifest(self, local_path: Path) -> dict[str, list]:
+        """Load the sync manifest for this destination
+
+        Args:
+            local_path: Local sync root containing the manifest
+
+        Returns:
+            Dict mapping relative key to [size, mtime_ns, etag], or an empty dict
+            if the manifest is missing, unreadable, or for another destination
+        """
+        manifest_path = local_path / MANIFEST_FILENAME
+        try:
+            data = json.loads(manifest_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+        if data.get("destination") != self._manifest_destination():
+            return {}
+
+        return data.get("files", {})
+
+    def _save_manifest(self, local_path: Path, files: dict[str, list]) -> None:
+        """Write the sync manifest for this destination
+
+        Args:
+            local_path: Local sync root to write the manifest into
+            files: Dict mapping relative key to [size, mtime_ns, etag]
+        """
+        manifest_path = local_path / MANIFEST_FILENAME
+        manifest_path.write_text(json.dumps({
+            "destination": self._manifest_destination(),
+            "files": files
+        }))
+
+    def _content_matches(self, local_file: Path, etag: str) -> bool:
+        """Check whether a local file matches a remote object's ETag
+
+        Single-part uploads have the object's MD5 as ETag. Multipart ETags
+        ("<md5>-<parts>") can't be recomputed without the original part size,
+        so a size match (checked by the caller) is taken as unchanged.
+
+        Args:
+            local_file: Path to local file
+            etag: Remote ETag without quotes
+
+        Returns:
+            True if the local file is considered identical to the remote object
+        """
+        if "-" in etag:
+            return True
+
+        md5 = hashlib.md5(usedforsecurity=False)
+        with open(local_file, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                md5.update(chunk)
+
+        return md5.hexdigest() == etag
+
+    def _upload_one(self, local_file: Path, relative_key: str) -> None:
+        """Upload a single file with the shared boto3 client (runs in worker threads)
+
+        Args:
+            local_file: Path to local file
+            relative_key: Key relative to the syncer's prefix
+        """
+        self.client.upload_file(
+            str(local_file),
+            self.bucket,
+            self._get_s3_key(relative_key),
+            Config=self.transfer_config
+        )
+
+    def _upload_all(
+        self,
+        uploads: list[tuple[str, Path, int]],
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> tuple[int, int]:
+        """Upload planned files through a bounded thread pool
+
+        Results are collected on the calling thread, so the counters and
+        progress callback need no locking.
+
+        Args:
+            uploads: List of (relative_key, local_file, size) to upload
+            progress_callback: Optional callable invoked as (completed, total)
+
+        Returns:
+            Tuple of (files_uploaded, bytes_transferred)
+        """
+        files_uploaded = 0
+        bytes_transferred = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._upload_one, local_file, relative_key): local_size
+                for relative_key, local_file, local_size in uploads
+            }
+            for future in as_completed(futures):
+                future.result()
+                files_uploaded += 1
+                bytes_transferred += futures[future]
+                if progress_callback:
+                    progress_callback(files_uploaded, len(uploads))
+
+        return files_uploaded, bytes_transferred
+
+    async def _upload_all_async(
+        self,
+        uploads: list[tuple[str, Path, int]],
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> tuple[int, int]:
+        """Upload planned files from one event loop with aioboto3
+
+        A semaphore of max_workers bounds the in-flight uploads; everything
+        runs on one thread, so there is no per-upload thread switch. All
+        uploads run to completion even if some fail; failures are then
+        raised together, naming every failed key.
+
+        Args:
+            uploads: List of (relative_key, local_file, size) to upload
+            progress_callback: Optional callable invoked as (completed, total)
+
+        Returns:
+            Tuple of (files_uploaded, bytes_transferred)
+        """
+        import aioboto3
+        from botocore.config import Config
+
+        session = aioboto3.Session(**self._session_kwargs)
+        semaphore = asyncio.Semaphore(self.max_workers)
+        files_uploaded = 0
+        bytes_transferred = 0
+
+        async with session.client(
+            "s3",
+            config=Config(
+                max_pool_connections=self.max_workers + self.transfer_config.max_concurrency,
+                retries={"max_attempts": 10, "mode": "adaptive"}
+            )
+        ) as client:
+            async def upload(relative_key: str, local_file: Path, local_size: int) -> None:
+                nonlocal files_uploaded, bytes_transferred
+                async with semaphore:
+                    await client.upload_file(
+                        str(local_file),
+                        self.bucket,
+                        self._get_s3_key(relative_key),
+                        Config=self.transfer_config
+                    )
+                files_uploaded += 1
+                bytes_transferred += local_size
+                if progress_callback:
+                    progress_callback(files_uploaded, len(uploads))
+
+            # Let every upload finish before the client closes, as the
+            # thread pool does, rather than leaving siblings of a failed
+            # upload in flight
+            results = await asyncio.gather(
+                *(upload(*item) for item in uploads),
+                return_exceptions=True
+            )
+
+        failed = [
+            (relative_key, result)
+            for (relative_key, _, _), result in zip(uploads, results)
+            if isinstance(result, BaseException)
+        ]
+        if failed:
+            raise RuntimeError(
+                f"Failed to upload {len(failed)} file(s): "
+                + ", ".join(relative_key for relative_key, _ in failed)
+            ) from failed[0][1]
+
+        return files_uploaded, bytes_transferred
+
+    def _run_async_uploads(
+        self,
+        uploads: list[tuple[str, Path, int]],
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> tuple[int, int]:
+        """Run _upload_all_async to completion, on uvloop when it is installed"""
+        try:
+            import uvloop
+        except ImportError:
+            run = asyncio.run
+        else:
+            run = uvloop.run
+
+        return run(self._upload_all_async(uploads, progress_callback))
 
     def sync(
         self,
         local_path: Path,
         delete: bool = False,
         dry_run: bool = False,
-        include_patterns: Optional[list[str]] = None
+        include_patterns: Optional[list[str]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        force_rescan: bool = False,
+        use_async: bool = False
     ) -> SyncResult:
         """Sync local directory to S3
 
         Implements incremental sync by comparing file sizes and modification times.
         Only uploads files that are new or have changed.
 
+        A manifest of the last synced (size, mtime_ns, etag) per file is kept in
+        `{local_path}/.sync-manifest`. Files whose stat still matches the manifest
+        and whose remote copy is unchanged are skipped without being read; other
+        files already present remotely are compared by MD5 against the ETag.
+
         Args:
             local_path: Local directory to sync
             delete: If True, delete S3 objects not present locally
             dry_run: If True, show what would be synced without doing it
             include_patterns: Optional list of glob patterns to include
                              (e.g., ["**/*.parquet"])
+            progress_callback: Optional callable invoked as (completed, total)
+                               after each upload finishes
+            force_rescan: If True, ignore the local manifest and re-check every file
+            use_async: If True, upload from an asyncio event loop with aioboto3
+                       (falls back to the thread pool if aioboto3 is not installed)
 
         Returns:
             SyncResult with sync statistics
@@ -181,10 +555,12 @@ class S3Syncer:
             ...     include_patterns=["**/*.parquet"]
             ... )
         """
-        if not local_path.exists():
+        try:
+            root_st = local_path.stat()
+        except OSError:
             raise ValueError(f"Local path does not exist: {local_path}")
 
-        if not local_path.is_dir():
+        if not stat.S_ISDIR(root_st.st_mode):
             raise ValueError(f"Local path is not a directory: {local_path}")
 
         start_time = time.time()
@@ -199,20 +575,13 @@ class S3Syncer:
         if include_patterns is None:
             include_patterns = ["**/*.parquet"]
 
-        # Collect local files matching patterns
-        local_files = set()
-        for pattern in include_patterns:
-            for file_path in local_path.glob(pattern):
-                if file_path.is_file():
-                    local_files.add(file_path)
-
-        # Build map of relative paths to local files
+        # Collect local files matching patterns in one walk, keeping the
+        # stat taken during the walk for planning
+        matchers = [_compile_include_pattern(pattern) for pattern in include_patterns]
         local_file_map = {}
-        for file_path in local_files:
-            relative_path = file_path.relative_to(local_path)
-            # Use forward slashes for S3
-            relative_key = str(relative_path).replace("\\", "/")
-            local_file_map[relative_key] = file_path
+        for relative_key, file_path, st in _scan_files(local_path):
+            if any(matcher.match(relative_key) for matcher in matchers):
+                local_file_map[relative_key] = (Path(file_path), st)
 
         if dry_run:
             print(f"DRY RUN: Would sync {len(local_file_map)} files to s3://{self.bucket}/{self.prefix}")
@@ -222,66 +591,67 @@ class S3Syncer:
                 files_uploaded=len(local_file_map),
                 files_skipped=0,
                 files_deleted=0,
-                bytes_transferred=sum(f.stat().st_size for f in local_file_map.values())
+                bytes_transferred=sum(st.st_size for _, st in local_file_map.values())
             )
 
-        # Get existing S3 objects
-        s3_prefix = self._get_s3_path("")
-        try:
-            s3_files = self.fs.ls(s3_prefix, detail=True)
-            s3_file_map = {}
-            for s3_obj in s3_files:
-                # s3_obj['name'] is like "bucket/prefix/path/file.parquet"
-                # Extract relative path by removing bucket and prefix
-                full_key = s3_obj['name']
-                # Remove bucket name
-                if full_key.startswith(f"{self.bucket}/"):
-                    key_without_bucket = full_key[len(f"{self.bucket}/"):]
-                    # Remove prefix
-                    if self.prefix and key_without_bucket.startswith(self.prefix):
-                        relative_key = key_without_bucket[len(self.prefix):]
-                    else:
-                        relative_key = key_without_bucket
-
-                    s3_file_map[relative_key] = {
-                        'size': s3_obj.get('size', 0),
-                        'mtime': s3_obj.get('LastModified')
-                    }
-        except FileNotFoundError:
-            # S3 prefix doesn't exist yet, that's ok
-            s3_file_map = {}
+        # Index every remote object under the prefix with one paginated listing
+        s3_file_map = self._list_remote()
+
+        # Load manifest from the previous sync to this destination
+        manifest = {} if force_rescan else self._load_manifest(local_path)
+        new_manifest = {}
 
-        # Sync files
-        for relative_key, local_file in local_file_map.items():
-            s3_path = self._get_s3_path(relative_key)
-            local_size = local_file.stat().st_size
-            local_mtime = local_file.stat().st_mtime
+        # Plan uploads
+        uploads = []
+        for relative_key, (local_file, st) in local_file_map.items():
+            local_size = st.st_size
 
             # Check if file needs uploading
             should_upload = True
-
-            if relative_key in s3_file_map:
-                s3_size = s3_file_map[relative_key]['size']
-
-                # Simple incremental check: skip if same size
-                # (could enhance with ETag/MD5 comparison if needed)
-                if s3_size == local_size:
+            remote = s3_file_map.get(relative_key)
+
+            if remote is not None and remote['size'] == local_size:
+                entry = manifest.get(relative_key)
+                # Whole-second mtimes (e.g. HFS+, FAT) can't reliably detect
+                # rewrites, so those files always get a content check
+                if (
+                    entry is not None
+                    and entry[0] == local_size
+                    and entry[1] == st.st_mtime_ns
+                    and st.st_mtime_ns % 1_000_000_000 != 0
+                    and entry[2] in (None, remote['etag'])
+                ):
                     should_upload = False
-                    files_skipped += 1
+                else:
+                    should_upload = not self._content_matches(local_file, remote['etag'])
 
             if should_upload:
-                # Upload file
-                self.fs.put(str(local_file), s3_path)
-                files_uploaded += 1
-                bytes_transferred += local_size
+                uploads.append((relative_key, local_file, local_size))
+                new_manifest[relative_key] = [local_size, st.st_mtime_ns, None]
+            else:
+                files_skipped += 1
+                new_manifest[relative_key] = [local_size, st.st_mtime_ns, remote['etag']]
+
+        # Upload concurrently
+        if uploads and use_async:
+            try:
+                import aioboto3  # noqa: F401
+            except ImportError:
+                print("Warning: aioboto3 is not installed, uploading with threads")
+                use_async = False
+
+        if uploads:
+            if use_async:
+                files_uploaded, bytes_transferred = self._run_async_uploads(uploads, progress_callback)
+            else:
+                files_uploaded, bytes_transferred = self._upload_all(uploads, progress_callback)
+
+        self._save_manifest(local_path, new_manifest)
 
         # Handle deletions
         if delete:
-            for relative_key in s3_file_map:
-                if relative_key not in local_file_map:
-                    s3_path = self._get_s3_path(relative_key)
-                    self.fs.rm(s3_path)
-                    files_deleted += 1
+            stale_keys = sorted(s3_file_map.keys() - local_file_map.keys())
+            files_deleted = self._delete_keys(stale_keys)
 
         return SyncResult(
             files_uploaded=files_uploaded,
@@ -348,7 +718,10 @@ def create_syncer(
     bucket: str,
     prefix: str = "",
     region: Optional[str] = None,
-    aws_profile: Optional[str] = None
+    aws_profile: Optional[str] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    s3_client=None,
+    transfer_config=None
 ) -> S3Syncer:
     """Factory function to create S3 syncer
 
@@ -357,6 +730,9 @@ def create_syncer(
         prefix: Optional prefix for all S3 keys
         region: AWS region
         aws_profile: AWS profile name (supports SSO)
+        max_workers: Number of concurrent upload threads
+        s3_client: Optional pre-built boto3 S3 client
+        transfer_config: Optional boto3 TransferConfig for multipart uploads
 
     Returns:
         S3Syncer instance
@@ -373,5 +749,8 @@ def create_syncer(
         bucket=bucket,
         prefix=prefix,
         region=region,
-        aws_profile=aws_profile
+        aws_profile=aws_profile,
+        max_workers=max_workers,
+        s3_client=s3_client,
+        transfer_config=transfer_config
     )
@@ -111,10 +111,8 @@ class SqlViewComposer:
             ORDER BY timestamp
             """
 
-        result = conn.execute(query).fetchdf()
-
-        # Convert to list of dicts
-        messages = result.to_dict('records')
+        # Arrow straight to Python rows: no pandas frame or numpy-boxed values
+        messages = conn.execute(query).fetch_arrow_table().to_pylist()
 
         # Ensure jira_metadata exists even if no JIRA cache
         if not jira_exists:
@@ -285,9 +283,8 @@ class SqlViewComposer:
                 """
 
                 try:
-                    thread_ts_result = conn.execute(phase1_query).fetchdf()
-                    if not thread_ts_result.empty:
-                        user_thread_ts_set.update(thread_ts_result['thread_ts'].tolist())
+                    thread_ts_rows = conn.execute(phase1_query).fetchall()
+                    user_thread_ts_set.update(row[0] for row in thread_ts_rows)
                 except Exception:
                     continue
 
@@ -405,8 +402,7 @@ class SqlViewComposer:
                             ORDER BY timestamp
                             """
 
-                    result = conn.execute(query).fetchdf()
-                    messages = result.to_dict('records')
+                    messages = conn.execute(query).fetch_arrow_table().to_pylist()
 
                     # Ensure jira_metadata exists
                     if not jira_exists:
@@ -107,9 +107,8 @@ class TimeBucketer:
 
             # Parse timestamp
             try:
-                ts = timestamp_str.replace("Z", "+00:00")
-                dt = datetime.fromisoformat(ts)
-            except (ValueError, AttributeError):
+                dt = datetime.fromisoformat(timestamp_str)
+            except (ValueError, TypeError):
                 continue
 
             # Determine bucket key
@@ -190,7 +189,6 @@ class TimeBucketer:
             return None
 
         try:
-            ts = timestamp_str.replace("Z", "+00:00")
-            return datetime.fromisoformat(ts)
-        except (ValueError, AttributeError):
+            return datetime.fromisoformat(timestamp_str)
+        except (ValueError, TypeError):
             return None
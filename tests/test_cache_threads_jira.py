@@ -174,6 +174,32 @@ class TestThreadsAndJiraCaching:
         tickets = [r[1] for r in result]
         assert "PROJ-123" in tickets
 
+    def test_collect_partition_ids_from_cached_files(self):
+        """Test that JIRA tickets and mentions are extracted from written partitions"""
+        from slack_intel.cli import _collect_partition_ids
+        from slack_intel import SlackMessage
+
+        msg_with_jira = sample_message_with_jira()
+        msg_with_mention = SlackMessage(
+            ts="1697654400.000001",
+            text="Ping <@U02JRGK9TCG> and <@U0ABC123>",
+            user="U999"
+        )
+
+        path1 = self.cache.save_messages([msg_with_jira], self.channel, "2023-10-18")
+        path2 = self.cache.save_messages([msg_with_mention], self.channel, "2023-10-19")
+
+        jira_ids, user_ids = _collect_partition_ids([path1, path2], include_jira=True)
+
+        assert {"PROJ-123", "PROJ-456"} <= jira_ids
+        assert user_ids == {"U02JRGK9TCG", "U0ABC123"}
+
+        # JIRA scan is skipped unless requested
+        jira_ids, _ = _collect_partition_ids([path1], include_jira=False)
+        assert jira_ids == set()
+
+        assert _collect_partition_ids([]) == (set(), set())
+
 
 class TestRealDataThreadsAndJira:
     """Integration tests using real Slack data (requires API access)"""
@@ -103,6 +103,24 @@ class TestBasicFormatting:
 
         assert first_pos < second_pos < third_pos
 
+    @pytest.mark.skipif(MessageViewFormatter is None, reason="MessageViewFormatter not implemented yet")
+    def test_format_to_stream_matches_format(self):
+        """Test streaming a view to a file handle writes exactly what format() returns"""
+        import io
+
+        messages = [
+            {"message_id": "111", "user_real_name": "Alice", "text": "First", "timestamp": "2023-10-20T10:00:00Z",
+             "replies": [{"message_id": "112", "user_real_name": "Bob", "text": "Reply", "timestamp": "2023-10-20T10:05:00Z"}]},
+            {"message_id": "222", "user_real_name": "Bob", "text": "Second", "timestamp": "2023-10-20T11:00:00Z"},
+        ]
+
+        context = ViewContext(channel_name="engineering", date_range="2023-10-20")
+        formatter = MessageViewFormatter()
+
+        for msgs in (messages, []):
+            stream = io.StringIO()
+            formatter.format_to(msgs, context, stream)
+            assert stream.getvalue() == formatter.format(msgs, context)
 
 class TestThreadFormatting:
     """Test formatting threaded messages"""
@@ -797,3 +815,28 @@ class TestCachedUserMentionResolution:
         assert "<@U003>" not in output
         assert "<@U004>" not in output
         assert "<@U005>" not in output
+
+    @pytest.mark.skipif(MessageViewFormatter is None, reason="MessageViewFormatter not implemented yet")
+    def test_resolved_mentions_not_reused_across_format_calls(self):
+        """Test that a reused formatter picks up new cached users on the next format()"""
+        messages = [
+            {
+                "message_id": "1",
+                "user_id": "U001",
+                "user_name": "alice",
+                "user_real_name": "Alice Chen",
+                "text": "Hey <@U003>",
+                "timestamp": "2023-10-20T10:00:00Z",
+            },
+        ]
+
+        context = ViewContext(channel_name="test")
+        formatter = MessageViewFormatter()
+        first = formatter.format(messages, context)
+        second = formatter.format(
+            messages, context,
+            cached_users={"U003": {"user_id": "U003", "user_real_name": "Carol Williams"}}
+        )
+
+        assert "<@U003>" in first
+        assert "@Carol Williams" in second
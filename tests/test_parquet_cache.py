@@ -41,6 +41,25 @@ class TestParquetCacheInitialization:
 
         assert cache.base_path == "cache/raw"
 
+    def test_cache_compression_setting(self, tmp_path):
+        """Test partitions are written with the configured codec"""
+        from slack_intel.parquet_cache import ParquetCache
+        import pyarrow.parquet as pq
+
+        channel = sample_channel()
+
+        default_cache = ParquetCache(base_path=str(tmp_path / "zstd"))
+        path = default_cache.save_messages([sample_message_basic()], channel, "2023-10-18")
+        assert pq.ParquetFile(path).metadata.row_group(0).column(0).compression == "ZSTD"
+
+        snappy_cache = ParquetCache(
+            base_path=str(tmp_path / "snappy"),
+            compression="snappy",
+            compression_level=None
+        )
+        path = snappy_cache.save_messages([sample_message_basic()], channel, "2023-10-18")
+        assert pq.ParquetFile(path).metadata.row_group(0).column(0).compression == "SNAPPY"
+
 
 class TestParquetCacheSaveMessages:
     """Test saving messages to Parquet"""
@@ -275,6 +294,39 @@ class TestParquetCacheSchema:
         assert table.num_rows == 5
 
 
+class TestParquetCachePartitionInfo:
+    """Test partition statistics"""
+
+    def test_partition_info_counts(self, tmp_path):
+        """Test row counts and sizes reported across partitions"""
+        from slack_intel.parquet_cache import ParquetCache
+
+        cache = ParquetCache(base_path=str(tmp_path / "test_cache"))
+        channel = sample_channel()
+
+        cache.save_messages(
+            [sample_message_basic(), sample_message_with_reactions()], channel, "2023-10-18"
+        )
+        cache.save_messages([sample_message_with_files()], channel, "2023-10-19")
+
+        info = cache.get_partition_info()
+
+        assert info["total_partitions"] == 2
+        assert info["total_messages"] == 3
+        assert sorted(p["row_count"] for p in info["partitions"]) == [1, 2]
+        assert info["total_size_bytes"] == sum(
+            Path(p["path"]).stat().st_size for p in info["partitions"]
+        )
+
+    def test_partition_info_empty_cache(self, tmp_path):
+        """Test partition info before anything is cached"""
+        from slack_intel.parquet_cache import ParquetCache
+
+        cache = ParquetCache(base_path=str(tmp_path / "missing"))
+
+        assert cache.get_partition_info() == {"total_partitions": 0, "partitions": []}
+
+
 class TestParquetCacheEdgeCases:
     """Test edge cases and error handling"""
 
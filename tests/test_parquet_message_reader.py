@@ -202,6 +202,25 @@ def sample_parquet_cache(tmp_path):
     return str(base_path.parent.parent)  # Return base cache directory
 
 
+@pytest.fixture
+def mixed_schema_cache(sample_parquet_cache):
+    """Add an older engineering partition cached before jira_tickets existed"""
+    partition_dir = Path(sample_parquet_cache) / "raw" / "messages" / "dt=2023-10-19" / "channel=engineering"
+    partition_dir.mkdir(parents=True)
+
+    table = pa.Table.from_pylist([
+        {
+            "message_id": "1697700000.000001",
+            "user_id": "U001",
+            "text": "Message from before ticket extraction",
+            "timestamp": "2023-10-19T10:00:00Z",
+        },
+    ])
+    pq.write_table(table, partition_dir / "data.parquet")
+
+    return sample_parquet_cache
+
+
 class TestParquetMessageReaderBasics:
     """Test basic read operations"""
 
@@ -228,6 +247,40 @@ class TestParquetMessageReaderBasics:
         timestamps = [msg["timestamp"] for msg in messages]
         assert timestamps == sorted(timestamps), "Messages should be sorted chronologically"
 
+    @pytest.mark.skipif(ParquetMessageReader is None, reason="ParquetMessageReader not implemented yet")
+    def test_read_with_filters(self, sample_parquet_cache):
+        """Test field filters select matching messages, still in order"""
+        reader = ParquetMessageReader(base_path=sample_parquet_cache)
+
+        replies = reader.read_channel(
+            channel="engineering", date="2023-10-20", filters={"is_thread_reply": True}
+        )
+        assert len(replies) == 2
+        assert all(msg["is_thread_reply"] for msg in replies)
+        assert [m["timestamp"] for m in replies] == sorted(m["timestamp"] for m in replies)
+
+        # None matches nulls; unknown fields read as None
+        no_thread = reader.read_channel(
+            channel="engineering", date="2023-10-20", filters={"thread_ts": None}
+        )
+        assert no_thread and all(msg["thread_ts"] is None for msg in no_thread)
+        assert reader.read_channel(
+            channel="engineering", date="2023-10-20", filters={"no_such_field": None}
+        ) == reader.read_channel(channel="engineering", date="2023-10-20")
+        assert reader.read_channel(
+            channel="engineering", date="2023-10-20", filters={"no_such_field": 1}
+        ) == []
+
+    @pytest.mark.skipif(ParquetMessageReader is None, reason="ParquetMessageReader not implemented yet")
+    def test_read_selected_columns(self, sample_parquet_cache):
+        """Test reading only some fields keeps chronological order"""
+        reader = ParquetMessageReader(base_path=sample_parquet_cache)
+
+        full = reader.read_channel(channel="engineering", date="2023-10-20")
+        texts = reader.read_channel(channel="engineering", date="2023-10-20", columns=["text"])
+
+        assert texts == [{"text": msg["text"]} for msg in full]
+
     @pytest.mark.skipif(ParquetMessageReader is None, reason="ParquetMessageReader not implemented yet")
     def test_read_nonexistent_partition_returns_empty(self, sample_parquet_cache):
         """Test querying non-existent partition returns empty list"""
@@ -327,7 +380,68 @@ class TestParquetMessageReaderMultiChannel:
         assert timestamps == sorted(timestamps)
 
 
-class TestParquetMessageReaderDataIntegrity:
+    @pytest.mark.skipif(ParquetMessageReader is None, reason="ParquetMessageReader not implemented yet")
+    def test_find_messages_with_ticket(self, sample_parquet_cache):
+        """Test ticket search across all channels and within one channel"""
+        reader = ParquetMessageReader(base_path=sample_parquet_cache)
+
+        everywhere = reader.find_messages_with_ticket("DESIGN-456", "2023-10-19", "2023-10-21")
+        assert len(everywhere) == 1
+        assert everywhere[0]["channel_name"] == "design"
+        assert "DESIGN-456" in everywhere[0]["jira_tickets"]
+
+        assert len(reader.find_messages_with_ticket("PROJ-123", "2023-10-20", "2023-10-21", channel="engineering")) == 1
+        assert reader.find_messages_with_ticket("DESIGN-456", "2023-10-20", "2023-10-21", channel="engineering") == []
+
+
+class TestParquetMessageReaderMixedSchemas:
+    """Test partitions cached with older schemas alongside newer ones"""
+
+    @pytest.mark.skipif(ParquetMessageReader is None, reason="ParquetMessageReader not implemented yet")
+    def test_date_range_keeps_newer_columns(self, mixed_schema_cache):
+        """Test columns missing from the first partition are still read"""
+        reader = ParquetMessageReader(base_path=mixed_schema_cache)
+
+        messages = reader.read_channel_range("engineering", "2023-10-19", "2023-10-20")
+
+        assert len(messages) == 5
+        assert messages[0]["jira_tickets"] is None
+        assert any("PROJ-123" in (m["jira_tickets"] or []) for m in messages)
+
+    @pytest.mark.skipif(ParquetMessageReader is None, reason="ParquetMessageReader not implemented yet")
+    def test_all_channels_keeps_newer_columns(self, mixed_schema_cache):
+        """Test columns missing from the first partition are kept across channels"""
+        reader = ParquetMessageReader(base_path=mixed_schema_cache)
+
+        table = reader._read_all_channels_table(["2023-10-19", "2023-10-20"])
+
+        assert "jira_tickets" in table.column_names
+        assert table.num_rows == 6
+
+    @pytest.mark.skipif(ParquetMessageReader is None, reason="ParquetMessageReader not implemented yet")
+    def test_find_ticket_in_channel_with_older_partition(self, mixed_schema_cache):
+        """Test ticket search in a channel whose first partition lacks jira_tickets"""
+        reader = ParquetMessageReader(base_path=mixed_schema_cache)
+
+        messages = reader.find_messages_with_ticket("PROJ-123", "2023-10-19", "2023-10-21", channel="engineering")
+        assert len(messages) == 1
+        assert "PROJ-123" in messages[0]["jira_tickets"]
+
+        # Only the older partition in range: no column to match against
+        assert reader.find_messages_with_ticket("PROJ-123", "2023-10-19", "2023-10-19", channel="engineering") == []
+
+    @pytest.mark.skipif(ParquetMessageReader is None, reason="ParquetMessageReader not implemented yet")
+    def test_find_ticket_across_channels_with_older_partition(self, mixed_schema_cache):
+        """Test all-channel ticket search when the earliest partition lacks jira_tickets"""
+        reader = ParquetMessageReader(base_path=mixed_schema_cache)
+
+        messages = reader.find_messages_with_ticket("DESIGN-456", "2023-10-19", "2023-10-21")
+        assert len(messages) == 1
+        assert messages[0]["channel_name"] == "design"
+
+        assert reader.find_messages_with_ticket("DESIGN-456", "2023-10-19", "2023-10-19") == []
+
+
     """Test data integrity and field preservation"""
 
     @pytest.mark.skipif(ParquetMessageReader is None, reason="ParquetMessageReader not implemented yet")
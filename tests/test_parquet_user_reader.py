@@ -187,3 +187,25 @@ class TestParquetUserReader:
             assert users['U001']['user_id'] == 'U001'
             assert users['U001']['user_name'] is None
             assert users['U001']['user_real_name'] is None
+
+    def test_read_users_reloads_only_when_file_changes(self):
+        """Test parsed users are reused until users.parquet is rewritten"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            users_path = Path(tmpdir) / 'users.parquet'
+            pq.write_table(pa.Table.from_pylist([{'user_id': 'U001', 'user_name': 'alice'}]), str(users_path))
+
+            reader = ParquetUserReader(base_path=tmpdir)
+            users = reader.read_users()
+            users.pop('U001')  # callers get a copy; the cache is unaffected
+            assert reader.get_user('U001')['user_name'] == 'alice'
+
+            pq.write_table(
+                pa.Table.from_pylist([
+                    {'user_id': 'U001', 'user_name': 'alice'},
+                    {'user_id': 'U002', 'user_name': 'bob'},
+                ]),
+                str(users_path)
+            )
+
+            assert reader.get_user_count() == 2
+            assert reader.find_user_by_name('bob') == 'U002'
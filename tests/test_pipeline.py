@@ -0,0 +1,287 @@
+"""Tests for the LLM processing pipeline (ChainProcessor)"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from slack_intel.pipeline import ChainProcessor, AnalysisResult, ResponseCache
+from slack_intel.pipeline.processors import OpenAIProcessor, PromptTemplates
+
+
+def text_events(text):
+    """Responses API stream events carrying text as a single delta"""
+    return [
+        MagicMock(type="response.output_text.delta", delta=text),
+        MagicMock(type="response.completed"),
+    ]
+
+
+async def async_text_events(text):
+    """Async version of text_events"""
+    for event in text_events(text):
+        yield event
+
+
+class TestBatchAnalysis:
+    """Test concurrent analysis with aanalyze_messages_batch"""
+
+    @pytest.mark.asyncio
+    @patch('slack_intel.pipeline.processors.AsyncOpenAI')
+    async def test_batch_returns_results_in_job_order(self, mock_async_openai):
+        """Each job gets its own result, failures are returned not raised"""
+        async def create(**kwargs):
+            if "broken" in kwargs["input"]:
+                raise RuntimeError("rate limited")
+            return async_text_events("Summary of " + kwargs["input"].split("Channel: ")[1].split("\n")[0])
+
+        mock_async_openai.return_value.responses.create = AsyncMock(side_effect=create)
+
+        processor = ChainProcessor(openai_api_key="test-key")
+        jobs = [
+            {"message_content": "Hello", "channel_name": name, "date_range": "2024-01-01"}
+            for name in ["backend-devs", "broken", "frontend-team"]
+        ]
+
+        results = await processor.aanalyze_messages_batch(jobs, max_concurrency=2)
+
+        assert len(results) == 3
+        assert isinstance(results[0], AnalysisResult)
+        assert results[0].summary == "Summary of backend-devs"
+        assert results[0].processing_steps[0].success
+        assert isinstance(results[1], Exception)
+        assert "rate limited" in str(results[1])
+        assert results[2].summary == "Summary of frontend-team"
+
+        # One shared async client for the whole batch
+        assert mock_async_openai.call_count == 1
+
+
+class TestResponseCache:
+    """Test that identical requests are answered from the ResponseCache"""
+
+    @patch('slack_intel.pipeline.processors.OpenAI')
+    def test_identical_request_served_from_cache(self, mock_openai_client, tmp_path):
+        """Second identical analysis makes no API call; a changed one does"""
+        mock_openai_client.return_value.responses.create.side_effect = (
+            lambda **kwargs: iter(text_events("Cached analysis"))
+        )
+
+        processor = ChainProcessor(
+            openai_api_key="test-key",
+            cache=ResponseCache(tmp_path / "responses.db")
+        )
+
+        first = processor.analyze_messages("Hello", "general", "2024-01-01")
+        second = processor.analyze_messages("Hello", "general", "2024-01-01")
+
+        assert first.summary == second.summary == "Cached analysis"
+        assert mock_openai_client.return_value.responses.create.call_count == 1
+
+        processor.analyze_messages("Hello again", "general", "2024-01-01")
+        assert mock_openai_client.return_value.responses.create.call_count == 2
+
+    @pytest.mark.parametrize("events", [
+        # Stream cut off before response.completed
+        [MagicMock(type="response.output_text.delta", delta="Partial")],
+        # Completed with no text
+        [MagicMock(type="response.completed")],
+    ])
+    @patch('slack_intel.pipeline.processors.OpenAI')
+    def test_incomplete_or_empty_response_not_cached(self, mock_openai_client, tmp_path, events):
+        """Only complete, non-empty summaries are stored for replay"""
+        mock_openai_client.return_value.responses.create.side_effect = lambda **kwargs: iter(events)
+
+        processor = ChainProcessor(
+            openai_api_key="test-key",
+            cache=ResponseCache(tmp_path / "responses.db")
+        )
+
+        processor.analyze_messages("Hello", "general", "2024-01-01")
+        processor.analyze_messages("Hello", "general", "2024-01-01")
+
+        assert mock_openai_client.return_value.responses.create.call_count == 2
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        """Entries older than ttl_seconds are treated as missing"""
+        cache = ResponseCache(tmp_path / "responses.db", ttl_seconds=-1)
+        key = cache.make_key({"model": "gpt-5", "input": "prompt"})
+        cache.set(key, "gpt-5", "summary")
+
+        assert cache.get(key) is None
+        assert ResponseCache(tmp_path / "responses.db").get(key) == "summary"
+
+
+class TestPromptLayout:
+    """Test that prompts keep the static part ahead of per-call data"""
+
+    @pytest.mark.parametrize("view_type,role,instructions", [
+        ("single_channel", PromptTemplates.ROLE_MESSAGES, PromptTemplates.INSTRUCTIONS_MESSAGES),
+        ("multi_channel", PromptTemplates.ROLE_MULTI_CHANNEL, PromptTemplates.INSTRUCTIONS_MULTI_CHANNEL),
+        ("user_timeline", PromptTemplates.ROLE_USER_TIMELINE, PromptTemplates.INSTRUCTIONS_USER_TIMELINE),
+    ])
+    def test_prompts_share_static_prefix(self, view_type, role, instructions):
+        """Role and instructions come first, identical for any channel and date"""
+        processor = OpenAIProcessor(api_key="test-key")
+        static_prefix = role + "\n\n" + instructions + "\n\n"
+
+        prompt = processor._build_prompt("Msg A", "backend", "2024-01-01", view_type, ["backend"])
+
+        assert prompt.startswith(static_prefix)
+        assert "Msg A" in prompt[len(static_prefix):]
+        assert "2024-01-01" in prompt[len(static_prefix):]
+
+
+class TestStreamingCallback:
+    """Test that on_chunk sees the summary as it streams"""
+
+    @patch('slack_intel.pipeline.processors.OpenAI')
+    def test_gpt5_streams_text_deltas(self, mock_openai_client):
+        """GPT-5 output arrives as text delta events; other events are skipped"""
+        mock_openai_client.return_value.responses.create.return_value = iter([
+            MagicMock(type="response.created"),
+            MagicMock(type="response.output_text.delta", delta="Key "),
+            MagicMock(type="response.output_text.delta", delta="discussions"),
+            MagicMock(type="response.completed"),
+        ])
+
+        processor = ChainProcessor(openai_api_key="test-key")
+        received = []
+
+        result = processor.analyze_messages("Hello", "general", "2024-01-01", on_chunk=received.append)
+
+        assert received == ["Key ", "discussions"]
+        assert result.summary == "Key discussions"
+        assert mock_openai_client.return_value.responses.create.call_args.kwargs["stream"] is True
+
+    @pytest.mark.parametrize("event,message", [
+        (MagicMock(type="response.failed", **{"response.error.message": "server_error"}), "Response failed: server_error"),
+        (MagicMock(type="response.incomplete", **{"response.incomplete_details.reason": "max_output_tokens"}), "Response incomplete: max_output_tokens"),
+        (MagicMock(type="error", message="rate limited"), "Stream error: rate limited"),
+    ])
+    @patch('slack_intel.pipeline.processors.OpenAI')
+    def test_gpt5_stream_failure_raises(self, mock_openai_client, event, message):
+        """Failed, incomplete and error events fail the step instead of returning partial text"""
+        mock_openai_client.return_value.responses.create.return_value = iter([
+            MagicMock(type="response.output_text.delta", delta="Partial"),
+            event,
+        ])
+
+        processor = ChainProcessor(openai_api_key="test-key")
+
+        with pytest.raises(Exception, match=message):
+            processor.analyze_messages("Hello", "general", "2024-01-01")
+
+    @patch('slack_intel.pipeline.processors.OpenAI')
+    def test_gpt5_without_streaming_returns_full_text(self, mock_openai_client):
+        """stream=False keeps the single-response path"""
+        mock_response = MagicMock()
+        mock_response.output_text = "Full analysis"
+        mock_openai_client.return_value.responses.create.return_value = mock_response
+
+        processor = ChainProcessor(openai_api_key="test-key")
+        result = processor.analyze_messages("Hello", "general", "2024-01-01", stream=False)
+
+        assert result.summary == "Full analysis"
+
+    @patch('slack_intel.pipeline.processors.OpenAI')
+    def test_on_chunk_receives_each_streamed_chunk(self, mock_openai_client):
+        """Chunks reach on_chunk in order and join into the summary"""
+        def make_chunk(content):
+            chunk = MagicMock()
+            chunk.choices[0].delta.content = content
+            return chunk
+
+        mock_openai_client.return_value.chat.completions.create.return_value = iter(
+            [make_chunk("Key "), make_chunk(None), make_chunk("discussions")]
+        )
+
+        processor = ChainProcessor(openai_api_key="test-key")
+        received = []
+
+        result = processor.analyze_messages(
+            "Hello", "general", "2024-01-01", model="gpt-4o", on_chunk=received.append
+        )
+
+        assert received == ["Key ", "discussions"]
+        assert result.summary == "Key discussions"
+
+
+class TestChunkedAnalysis:
+    """Test map-reduce analysis of long message content"""
+
+    VIEW = (
+        "Channel: #general\n\n"
+        + "".join(
+            f"💬 MESSAGE #{i}\n👤 Alice at 10:0{i}:\n   {'word ' * 40}\n\n"
+            f"  🧵 THREAD REPLIES:\n    ↳ REPLY #1: Bob at 10:0{i}:\n       ok\n\n"
+            for i in range(1, 7)
+        )
+        + "📊 Summary: 6 messages"
+    )
+
+    def test_partition_splits_only_at_message_starts(self):
+        """Parts rejoin to the input and each one after the first starts a message"""
+        processor = ChainProcessor(openai_api_key="test-key")
+
+        parts = processor._partition(self.VIEW, target_tokens=120, model="gpt-5")
+
+        assert len(parts) > 1
+        assert "".join(parts) == self.VIEW
+        assert all(part.startswith("💬 MESSAGE #") for part in parts[1:])
+        assert all(part.count("💬 MESSAGE #") == part.count("🧵 THREAD REPLIES") for part in parts)
+
+    def test_partition_keeps_small_content_whole(self):
+        """Content within the budget is a single part"""
+        processor = ChainProcessor(openai_api_key="test-key")
+
+        assert processor._partition(self.VIEW, target_tokens=100_000, model="gpt-5") == [self.VIEW]
+
+    @pytest.mark.asyncio
+    @patch('slack_intel.pipeline.processors.AsyncOpenAI')
+    async def test_parts_summarized_then_reduced(self, mock_async_openai):
+        """Each part gets a step and the final summary comes from the reduce call"""
+        async def create(**kwargs):
+            if "Part 1 of" in kwargs["input"]:
+                return async_text_events("Combined analysis")
+            return async_text_events("Partial analysis")
+
+        mock_async_openai.return_value.responses.create = AsyncMock(side_effect=create)
+        processor = ChainProcessor(openai_api_key="test-key")
+
+        result = await processor.aanalyze_messages(
+            self.VIEW, "general", "2024-01-01", chunk_tokens=120
+        )
+
+        step_names = [step.step_name for step in result.processing_steps]
+        part_count = len(step_names) - 1
+        assert part_count > 1
+        assert sorted(step_names[:-1]) == sorted(f"process_messages_part_{i}" for i in range(1, part_count + 1))
+        assert step_names[-1] == "reduce_summaries"
+        assert result.summary == "Combined analysis"
+        assert mock_async_openai.return_value.responses.create.call_count == part_count + 1
+
+    @pytest.mark.asyncio
+    @patch('slack_intel.pipeline.processors.AsyncOpenAI')
+    async def test_failed_part_cancels_the_others(self, mock_async_openai):
+        """One failing part stops the parts still in flight and fails the analysis"""
+        cancelled = []
+
+        async def create(**kwargs):
+            if "MESSAGE #1\n" in kwargs["input"]:
+                await asyncio.sleep(0.01)
+                raise RuntimeError("part failed")
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(kwargs["input"])
+                raise
+
+        mock_async_openai.return_value.responses.create = AsyncMock(side_effect=create)
+        processor = ChainProcessor(openai_api_key="test-key")
+
+        with pytest.raises(Exception, match="part failed"):
+            await processor.aanalyze_messages(
+                self.VIEW, "general", "2024-01-01", chunk_tokens=120
+            )
+
+        assert cancelled